@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Static asset size and compression budget checker for public/
+
+Measures raw, gzip and brotli sizes of every served asset and fetches each
+one through BASE_URL to verify compression, cache headers and conditional
+requests (304 Not Modified). frontend.Dockerfile serves all of public/, so
+the asset list is read from the directory and a file without a budget fails.
+
+Usage:
+    python asset_budgets.py [--base-url URL] [--skip-http]
+"""
+import argparse
+import gzip
+import os
+import sys
+import urllib.error
+import urllib.request
+
+import brotli
+
+
+PUBLIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public")
+
+# nginx only compresses responses of at least gzip_min_length bytes (nginx.conf)
+GZIP_MIN_LENGTH = 1024
+
+# Budgets in bytes. cache_control marks assets that nginx.conf serves with a
+# long-lived Cache-Control header; HTML is revalidated through ETag instead.
+ASSET_BUDGETS = {
+    "app.js": {"raw": 20 * 1024, "gzip": 5 * 1024, "cache_control": True},
+    "auth.js": {"raw": 10 * 1024, "gzip": 2560, "cache_control": True},
+    # Jest test kept in public/, so nginx serves it too
+    "navigation.test.js": {"raw": 10 * 1024, "gzip": 2560, "cache_control": True},
+    "style.css": {"raw": 12 * 1024, "gzip": 3 * 1024, "cache_control": True},
+    "index.html": {"raw": 10 * 1024, "gzip": 2560, "cache_control": False},
+    "login.html": {"raw": 8 * 1024, "gzip": 1536, "cache_control": False},
+    "health.html": {"raw": 1024, "gzip": 512, "cache_control": False},
+}
+
+
+def served_assets():
+    """
+    Names of the files nginx serves from public/
+    """
+    return sorted(
+        name for name in os.listdir(PUBLIC_DIR)
+        if os.path.isfile(os.path.join(PUBLIC_DIR, name)) and not name.startswith(".")
+    )
+
+
+def measure_sizes(name):
+    """
+    Return the raw, gzip and brotli sizes of an asset in bytes
+    """
+    with open(os.path.join(PUBLIC_DIR, name), "rb") as f:
+        data = f.read()
+    return {
+        "raw": len(data),
+        "gzip": len(gzip.compress(data, compresslevel=6)),
+        "brotli": len(brotli.compress(data)),
+    }
+
+
+def check_sizes(name):
+    """
+    Compare an asset's sizes against its budget and return the violations
+    """
+    if name not in ASSET_BUDGETS:
+        return [f"{name}: served from public/ but has no entry in ASSET_BUDGETS"]
+    budget = ASSET_BUDGETS[name]
+    sizes = measure_sizes(name)
+    problems = []
+    for kind in ("raw", "gzip"):
+        if sizes[kind] > budget[kind]:
+            problems.append(
+                f"{name}: {kind} size {sizes[kind]} B exceeds budget of {budget[kind]} B"
+            )
+    return problems
+
+
+def fetch(url, headers=None):
+    """
+    GET a URL and return (status, headers, body) without raising on 304/4xx
+    """
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def check_served(base_url, name):
+    """
+    Verify compression, cache headers and conditional requests for an asset
+
+    Cache-Control is only required for assets whose budget asks for it.
+    """
+    budget = ASSET_BUDGETS.get(name, {})
+    url = f"{base_url.rstrip('/')}/{name}"
+    problems = []
+
+    status, headers, _ = fetch(url, {"Accept-Encoding": "gzip, br"})
+    if status != 200:
+        return [f"{name}: expected 200, got {status}"]
+
+    encoding = headers.get("Content-Encoding", "")
+    if measure_sizes(name)["raw"] >= GZIP_MIN_LENGTH and encoding not in ("gzip", "br"):
+        problems.append(f"{name}: served without compression (Content-Encoding: {encoding or 'none'})")
+
+    if budget.get("cache_control") and not headers.get("Cache-Control"):
+        problems.append(f"{name}: missing Cache-Control header")
+
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag:
+        problems.append(f"{name}: missing ETag header")
+    else:
+        status, _, _ = fetch(url, {"Accept-Encoding": "gzip, br", "If-None-Match": etag})
+        if status != 304:
+            problems.append(f"{name}: If-None-Match returned {status}, expected 304")
+
+    if last_modified:
+        status, _, _ = fetch(url, {"If-Modified-Since": last_modified})
+        if status != 304:
+            problems.append(f"{name}: If-Modified-Since returned {status}, expected 304")
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check static asset size and caching budgets")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "http://localhost"),
+                        help="Application URL to fetch assets from (default: BASE_URL)")
+    parser.add_argument("--skip-http", action="store_true",
+                        help="Only check file sizes, do not fetch through the server")
+    args = parser.parse_args()
+
+    print(f"{'Asset':<20}{'Raw':>10}{'Gzip':>10}{'Brotli':>10}")
+    print("-" * 50)
+    problems = []
+    for name in served_assets():
+        sizes = measure_sizes(name)
+        print(f"{name:<20}{sizes['raw']:>10}{sizes['gzip']:>10}{sizes['brotli']:>10}")
+        problems.extend(check_sizes(name))
+        if not args.skip_http:
+            problems.extend(check_served(args.base_url, name))
+
+    print("-" * 50)
+    if problems:
+        for problem in problems:
+            print(f"FAIL {problem}")
+        sys.exit(1)
+    print("All assets within budget")
+
+
+if __name__ == "__main__":
+    main()
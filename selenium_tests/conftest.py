@@ -5,14 +5,239 @@ import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 import os
+import re
+import time
+
+import cpu_profiler
+from data_lifecycle import DatabaseSnapshot, register_user, worker_base_url
+from network_capture import enable_network_log
+from network_profiles import DEFAULT_PROFILE, apply_profile, parse_profiles
+from performance import PerformanceRecorder, TestTimer, navigation_timing
+
+
+def pytest_addoption(parser):
+    """
+    Command line options for emulation, profiling, performance output and test data
+    """
+    parser.addoption(
+        "--network-profile",
+        action="store",
+        default=None,
+        help="Comma-separated emulation profiles to run every browser test under "
+             "(e.g. none,slow-3g,cpu-4x). Each profile becomes a test matrix entry."
+    )
+    parser.addoption(
+        "--perf-output",
+        action="store",
+        default="performance_results.json",
+        help="Path of the JSON file that receives performance timings"
+    )
+    parser.addoption(
+        "--profile-scenario",
+        action="store",
+        default=None,
+        help="Comma-separated test names (substring match, e.g. test_student_creation) "
+             "to record a Chrome performance trace and JS CPU profile for"
+    )
+    parser.addoption(
+        "--profile-dir",
+        action="store",
+        default="profiles",
+        help="Directory that receives trace, CPU profile and summary files"
+    )
+    parser.addoption(
+        "--db-reset",
+        action="store_true",
+        default=False,
+        help="Give each worker its own database (MONGO_URL) and restore it "
+             "from a snapshot before every test"
+    )
+    parser.addoption(
+        "--rebuild-snapshot",
+        action="store_true",
+        default=False,
+        help="Re-seed the database snapshot instead of reusing the stored one"
+    )
+    parser.addoption(
+        "--soak",
+        action="store_true",
+        default=False,
+        help="Run the long-lived SPA soak tests (skipped otherwise)"
+    )
+    parser.addoption(
+        "--soak-iterations",
+        action="store",
+        type=int,
+        default=200,
+        help="Number of soak loop iterations (default: 200)"
+    )
+    parser.addoption(
+        "--soak-duration",
+        action="store",
+        type=float,
+        default=None,
+        help="Run the soak loop for this many seconds instead of a fixed iteration count"
+    )
+    parser.addoption(
+        "--tiered",
+        action="store_true",
+        default=False,
+        help="Run smoke tests first and skip the regression tier if any of them fails"
+    )
+    parser.addoption(
+        "--smoke-budget",
+        action="store",
+        type=float,
+        default=10.0,
+        help="Hard time budget in seconds for the smoke tier (default: 10)"
+    )
+
+
+def pytest_configure(config):
+    option = config.getoption("--network-profile")
+    if option:
+        try:
+            parse_profiles(option)
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+    config.performance = PerformanceRecorder()
+    if not hasattr(config, "workerinput"):
+        # Never leave a previous run's results for the sampler or trend store to pick up
+        perf_output = config.getoption("--perf-output")
+        if os.path.exists(perf_output):
+            os.remove(perf_output)
+    config.smoke_tier = {"start": None, "end": None, "failed": False, "over_budget": False,
+                         "restored": False}
+    config.profile_summaries = []
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--tiered"):
+        # Stable sort keeps the original order within each tier
+        items.sort(key=lambda item: "smoke" not in item.keywords)
+
+    if config.getoption("--soak"):
+        return
+    skip_soak = pytest.mark.skip(reason="soak tests run only with --soak")
+    for item in items:
+        if "soak" in item.keywords:
+            item.add_marker(skip_soak)
+
+
+def pytest_runtest_setup(item):
+    tier = item.config.smoke_tier
+    if "smoke" in item.keywords and tier["start"] is None:
+        tier["start"] = time.perf_counter()
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Expand browser tests into one entry per selected emulation profile
+
+    A network_profile marker on the test takes precedence over --network-profile.
+    """
+    if "driver" not in metafunc.fixturenames:
+        return
+
+    marker = metafunc.definition.get_closest_marker("network_profile")
+    if marker is not None:
+        profiles = list(marker.args)
+    else:
+        option = metafunc.config.getoption("--network-profile")
+        if not option:
+            return
+        profiles = parse_profiles(option)
+
+    metafunc.parametrize("network_profile", profiles, indirect=True, ids=profiles)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+
+    if "smoke" in item.keywords:
+        tier = item.config.smoke_tier
+        tier["end"] = time.perf_counter()
+        budget = item.config.getoption("--smoke-budget")
+        if report.failed:
+            tier["failed"] = True
+            if item.config.getoption("--tiered"):
+                item.session.shouldstop = "smoke tier failed, regression tier skipped"
+        if tier["end"] - tier["start"] > budget and not tier["over_budget"]:
+            tier["over_budget"] = True
+            item.session.shouldstop = f"smoke tier exceeded its {budget:g}s time budget"
+
+    if call.when == "call":
+        item.config.performance.record(
+            item.nodeid, "duration", call.duration * 1000,
+            network_profile=getattr(item, "network_profile", DEFAULT_PROFILE),
+            outcome=report.outcome,
+            start=call.start, end=call.stop
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for name, summary in config.profile_summaries:
+        terminalreporter.write_sep("-", f"top functions for {name}")
+        terminalreporter.write_line(summary)
+
+    tier = config.smoke_tier
+    if tier["start"] is None:
+        return
+    elapsed = tier["end"] - tier["start"]
+    budget = config.getoption("--smoke-budget")
+    verdict = "EXCEEDED" if tier["over_budget"] else ("FAILED" if tier["failed"] else "passed")
+    terminalreporter.write_sep("-", f"smoke tier {verdict}: {elapsed:.2f}s of {budget:g}s budget")
+
+
+def pytest_sessionfinish(session):
+    tier = session.config.smoke_tier
+    if tier["start"] is not None:
+        session.config.performance.record(
+            "smoke", "smoke_tier", (tier["end"] - tier["start"]) * 1000
+        )
+        if tier["over_budget"] and session.exitstatus == 0:
+            session.exitstatus = 1
+
+    recorder = getattr(session.config, "performance", None)
+    if recorder is None:
+        return
+    if hasattr(session.config, "workerinput"):
+        # xdist worker: hand the records to the controller, which writes one merged file
+        session.config.workeroutput["performance_records"] = recorder.records
+    elif recorder.records:
+        recorder.write(session.config.getoption("--perf-output"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Merge a finished xdist worker's performance records on the controller
+    """
+    records = getattr(node, "workeroutput", {}).get("performance_records", [])
+    node.config.performance.records.extend(records)
 
 
 @pytest.fixture(scope="function")
-def driver():
+def network_profile(request):
     """
-    Create a Chrome WebDriver instance for each test
+    Name of the emulation profile applied to the current test's browser
+    """
+    name = getattr(request, "param", DEFAULT_PROFILE)
+    parse_profiles(name)
+    request.node.network_profile = name
+    return name
+
+
+def chrome_options_for_tests():
+    """
+    Chrome options shared by every test browser
     """
     chrome_options = Options()
     chrome_options.add_argument("--headless")  # Run in headless mode for CI/CD
@@ -20,7 +245,13 @@ def driver():
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    
+    return chrome_options
+
+
+def create_chrome_driver(chrome_options):
+    """
+    Start Chrome with a matching ChromeDriver
+    """
     # Get the correct ChromeDriver path
     driver_path = ChromeDriverManager().install()
     
@@ -38,19 +269,64 @@ def driver():
     service = Service(driver_path)
     driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.implicitly_wait(10)  # Wait up to 10 seconds for elements
+    return driver
+
+
+@pytest.fixture(scope="function")
+def driver(request, network_profile):
+    """
+    Create a Chrome WebDriver instance for each test
+    """
+    scenarios = request.config.getoption("--profile-scenario")
+    profiling = bool(scenarios) and any(
+        name.strip() and name.strip() in request.node.name for name in scenarios.split(",")
+    )
+
+    chrome_options = chrome_options_for_tests()
+    if profiling:
+        cpu_profiler.enable_tracing(chrome_options)
+    if request.node.get_closest_marker("capture_network"):
+        enable_network_log(chrome_options)
+    
+    driver = create_chrome_driver(chrome_options)
+    
+    # Throttle network and CPU according to the selected profile
+    apply_profile(driver, network_profile)
+    
+    if profiling:
+        cpu_profiler.start_cpu_profile(driver)
     
     yield driver
     
-    driver.quit()
+    # Quit even when collecting the profile fails; the failure is still reported
+    try:
+        if profiling:
+            profile = cpu_profiler.stop_cpu_profile(driver)
+            trace_events = cpu_profiler.collect_trace_events(driver)
+            name = re.sub(r"[^\w.-]+", "_", request.node.name)
+            summary = cpu_profiler.write_artifacts(
+                request.config.getoption("--profile-dir"), name, trace_events, profile
+            )
+            request.config.profile_summaries.append((request.node.name, summary))
+        
+        # Page-load metrics of the last page the test visited
+        for metric, value in navigation_timing(driver).items():
+            if value:
+                request.config.performance.record(
+                    request.node.nodeid, metric, value, network_profile=network_profile
+                )
+    finally:
+        driver.quit()
 
 
 @pytest.fixture(scope="session")
 def base_url():
     """
     Get the base URL for the application
-    Can be overridden with BASE_URL environment variable
+    Can be overridden with BASE_URL environment variable, or per xdist
+    worker with BASE_URL_<WORKER> (e.g. BASE_URL_GW0)
     """
-    return os.getenv("BASE_URL", "http://localhost")
+    return worker_base_url("http://localhost")
 
 
 @pytest.fixture(scope="session")
@@ -64,3 +340,132 @@ def test_user():
         "password": "TestPassword123!",
         "fullName": "Test User"
     }
+
+
+@pytest.fixture(scope="function")
+def perf(request, network_profile):
+    """
+    Record named timings for the current test into the performance output
+    """
+    return TestTimer(request.config.performance, request.node.nodeid, network_profile)
+
+
+def login_via_api(driver, base_url, user, timeout=10):
+    """
+    Log in with a same-origin fetch and open the dashboard
+
+    The session cookie lands in the browser without going through the login
+    form. The user is registered through the API first (ignored if it exists).
+    """
+    register_user(base_url, user)
+    driver.get(f"{base_url}/login.html")
+    status = driver.execute_async_script("""
+        const [username, password, done] = arguments;
+        fetch('/api/auth/login', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({username, password}),
+            credentials: 'include'
+        }).then(r => done(r.status), () => done(0));
+    """, user["username"], user["password"])
+    assert status == 200, f"API login failed with status {status}"
+
+    driver.get(f"{base_url}/index.html")
+    WebDriverWait(driver, timeout).until(
+        EC.visibility_of_element_located((By.ID, "navbar"))
+    )
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, base_url, test_user):
+    """
+    Driver with an authenticated session on the dashboard
+    """
+    login_via_api(driver, base_url, test_user)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def shared_driver():
+    """
+    One warm Chrome instance shared by the whole smoke tier
+    """
+    driver = create_chrome_driver(chrome_options_for_tests())
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture(scope="function")
+def smoke_timeout(request, shared_driver):
+    """
+    Seconds left in the smoke budget, applied to the shared driver's timeouts
+
+    Implicit waits, page loads and scripts on the shared driver give up when
+    the budget runs out, so a hanging smoke test fails within the budget
+    instead of after it. Use the value as the timeout of explicit waits.
+    """
+    tier = request.config.smoke_tier
+    budget = request.config.getoption("--smoke-budget")
+    remaining = budget - (time.perf_counter() - tier["start"])
+    if remaining <= 0:
+        pytest.fail(f"smoke tier exceeded its {budget:g}s time budget")
+    shared_driver.implicitly_wait(min(remaining, 10))
+    shared_driver.set_page_load_timeout(remaining)
+    shared_driver.set_script_timeout(remaining)
+    return remaining
+
+
+@pytest.fixture(scope="function")
+def smoke_session(shared_driver, smoke_timeout, base_url, test_user):
+    """
+    Shared driver on the dashboard with the single smoke-tier session
+
+    Reuses the session established by the smoke login test and only logs in
+    again when the browser is not authenticated.
+    """
+    # Check the session from a static page that does not redirect on its own
+    shared_driver.get(f"{base_url}/health.html")
+    authenticated = shared_driver.execute_async_script("""
+        const done = arguments[0];
+        fetch('/api/auth/me', {credentials: 'include'}).then(r => done(r.ok), () => done(false));
+    """)
+    if authenticated:
+        shared_driver.get(f"{base_url}/index.html")
+        WebDriverWait(shared_driver, smoke_timeout).until(
+            EC.visibility_of_element_located((By.ID, "navbar"))
+        )
+    else:
+        login_via_api(shared_driver, base_url, test_user, timeout=smoke_timeout)
+    return shared_driver
+
+
+@pytest.fixture(scope="session")
+def database_snapshot(request, base_url, test_user):
+    """
+    Snapshot of the seeded worker database, built once per session
+    """
+    snapshot = DatabaseSnapshot()
+    snapshot.build(
+        lambda: register_user(base_url, test_user),
+        rebuild=request.config.getoption("--rebuild-snapshot")
+    )
+    yield snapshot
+    snapshot.close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_database(request):
+    """
+    Restore the worker database from the snapshot before each test (--db-reset)
+
+    The smoke tier is restored once, before its first test: a later restore
+    would drop the single session its tests share.
+    """
+    if not request.config.getoption("--db-reset"):
+        return
+    if "smoke" in request.node.keywords:
+        tier = request.config.smoke_tier
+        if tier["restored"]:
+            return
+        tier["restored"] = True
+    request.getfixturevalue("database_snapshot").restore()
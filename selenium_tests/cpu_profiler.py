@@ -0,0 +1,148 @@
+"""
+Chrome performance trace and sampled JS CPU profile capture
+
+Used by the --profile-scenario option in conftest.py to turn "the UI feels
+slow" reports into a list of hot functions in public/app.js and public/auth.js.
+"""
+import json
+import os
+
+# Trace categories requested from ChromeDriver's performance log
+TRACE_CATEGORIES = ",".join([
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "v8.execute",
+    "blink.user_timing",
+])
+
+# Sampling interval of the JS CPU profiler in microseconds
+SAMPLING_INTERVAL_US = 100
+
+# Scripts whose functions are listed in the top-functions summary
+APP_SCRIPTS = ("/app.js", "/auth.js")
+
+
+def enable_tracing(chrome_options):
+    """
+    Ask ChromeDriver to record a performance trace for this session
+    """
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    chrome_options.add_experimental_option("perfLoggingPrefs", {
+        "enableNetwork": False,
+        "enablePage": False,
+        "traceCategories": TRACE_CATEGORIES,
+    })
+
+
+def start_cpu_profile(driver):
+    driver.execute_cdp_cmd("Profiler.enable", {})
+    driver.execute_cdp_cmd("Profiler.setSamplingInterval", {"interval": SAMPLING_INTERVAL_US})
+    driver.execute_cdp_cmd("Profiler.start", {})
+
+
+def stop_cpu_profile(driver):
+    """
+    Stop the sampling profiler and return the CDP Profile object
+    """
+    profile = driver.execute_cdp_cmd("Profiler.stop", {})["profile"]
+    driver.execute_cdp_cmd("Profiler.disable", {})
+    return profile
+
+
+def collect_trace_events(driver):
+    """
+    Drain the trace events ChromeDriver has buffered in the performance log
+    """
+    events = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message.get("method") == "Tracing.dataCollected":
+            events.append(message["params"])
+    return events
+
+
+def summarize_profile(profile, scripts=APP_SCRIPTS):
+    """
+    Aggregate self and total time in milliseconds per function
+
+    Returns rows sorted by self time, limited to functions defined in one of
+    the given scripts. Recursive calls count once towards total time.
+    """
+    nodes = {node["id"]: node for node in profile["nodes"]}
+    parents = {}
+    for node in profile["nodes"]:
+        for child in node.get("children", []):
+            parents[child] = node["id"]
+
+    # Each sample lasts until the next one is taken
+    self_us = dict.fromkeys(nodes, 0)
+    samples = profile.get("samples", [])
+    deltas = profile.get("timeDeltas", [])
+    for i, node_id in enumerate(samples[:-1]):
+        self_us[node_id] += deltas[i + 1]
+
+    def key(node_id):
+        frame = nodes[node_id]["callFrame"]
+        return (frame["functionName"] or "(anonymous)", frame["url"], frame["lineNumber"] + 1)
+
+    totals = {}
+    for node_id, node in nodes.items():
+        k = key(node_id)
+        row = totals.setdefault(k, {"self_us": 0, "total_us": 0})
+        row["self_us"] += self_us[node_id]
+
+        # Attribute this node's self time to every distinct function on its stack
+        seen = set()
+        current = node_id
+        while current is not None:
+            ancestor = key(current)
+            if ancestor not in seen:
+                seen.add(ancestor)
+                totals.setdefault(ancestor, {"self_us": 0, "total_us": 0})
+                totals[ancestor]["total_us"] += self_us[node_id]
+            current = parents.get(current)
+
+    rows = []
+    for (function, url, line), row in totals.items():
+        if not url.endswith(scripts):
+            continue
+        rows.append({
+            "function": function,
+            "script": url.rsplit("/", 1)[-1],
+            "line": line,
+            "self_ms": round(row["self_us"] / 1000, 2),
+            "total_ms": round(row["total_us"] / 1000, 2),
+        })
+    rows.sort(key=lambda r: (r["self_ms"], r["total_ms"]), reverse=True)
+    return rows
+
+
+def format_summary(rows, limit=20):
+    lines = [f"{'Self (ms)':>10}{'Total (ms)':>12}  Function"]
+    for row in rows[:limit]:
+        lines.append(
+            f"{row['self_ms']:>10.2f}{row['total_ms']:>12.2f}  "
+            f"{row['function']} ({row['script']}:{row['line']})"
+        )
+    return "\n".join(lines)
+
+
+def write_artifacts(directory, name, trace_events, profile):
+    """
+    Save the trace, CPU profile and summary for one scenario
+
+    The .json trace loads in the DevTools Performance panel and the
+    .cpuprofile in any V8 CPU profile viewer.
+    """
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, name)
+
+    with open(f"{base}.trace.json", "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace_events}, f)
+    with open(f"{base}.cpuprofile", "w", encoding="utf-8") as f:
+        json.dump(profile, f)
+
+    summary = format_summary(summarize_profile(profile))
+    with open(f"{base}.summary.txt", "w", encoding="utf-8") as f:
+        f.write(summary + "\n")
+    return summary
@@ -0,0 +1,159 @@
+"""
+Per-worker test database lifecycle with snapshot/restore
+
+Each pytest worker gets its own MongoDB database. The seed data (the shared
+test user) is built once through the backend API, captured as a snapshot,
+and restored in bulk before every test. Restoring drops collections instead
+of deleting documents, so reset time stays constant no matter how much a
+test wrote. Every collection is recreated with its indexes, including the
+unique and TTL indexes the backend only creates when it connects.
+
+The backend under test must point at the worker database, e.g.
+    MONGODB_URI=mongodb://localhost:27017/examdb_test_main node server.js
+
+When running distributed, give each worker its own backend with
+BASE_URL_<WORKER> (e.g. BASE_URL_GW0=http://localhost:3001); workers without
+one fall back to BASE_URL.
+"""
+import json
+import os
+import urllib.error
+import urllib.request
+
+from pymongo import ASCENDING, IndexModel, MongoClient
+
+
+MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
+TEST_DB_PREFIX = os.getenv("TEST_DB_PREFIX", "examdb_test")
+
+# Indexes the backend creates at connect time (Mongoose schemas and
+# connect-mongo). Dropping the database removes them, so they are recreated
+# before seeding and become part of the snapshot.
+SCHEMA_INDEXES = {
+    "users": [
+        IndexModel([("username", ASCENDING)], name="username_1", unique=True, background=True),
+        IndexModel([("email", ASCENDING)], name="email_1", unique=True, background=True),
+    ],
+    "students": [
+        IndexModel([("registrationNumber", ASCENDING)], name="registrationNumber_1",
+                   unique=True, background=True),
+    ],
+    "sessions": [
+        IndexModel([("expires", ASCENDING)], name="expires_1", expireAfterSeconds=0),
+    ],
+}
+
+
+def worker_id():
+    """
+    Name of the current pytest worker ("main" when not running distributed)
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def worker_database_name():
+    return f"{TEST_DB_PREFIX}_{worker_id()}"
+
+
+def worker_base_url(default="http://localhost"):
+    """
+    Backend URL of the current worker: BASE_URL_<WORKER>, then BASE_URL
+    """
+    return os.getenv(f"BASE_URL_{worker_id().upper()}", os.getenv("BASE_URL", default))
+
+
+def register_user(base_url, user):
+    """
+    Register a user through the backend API, ignoring "already exists"
+    """
+    request = urllib.request.Request(
+        f"{base_url}/api/auth/register",
+        data=json.dumps(user).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        urllib.request.urlopen(request, timeout=10).close()
+    except urllib.error.HTTPError as e:
+        if e.code != 400:
+            raise
+
+
+class DatabaseSnapshot:
+    """
+    Snapshot of a worker database that can be restored in bulk
+
+    The snapshot is persisted in a sibling "<db>_snapshot" database so later
+    runs skip seeding, and cached in memory so restores never re-read it.
+    """
+
+    def __init__(self, mongo_url=MONGO_URL, db_name=None):
+        self.client = MongoClient(mongo_url, serverSelectionTimeoutMS=5000)
+        self.db_name = db_name or worker_database_name()
+        self.db = self.client[self.db_name]
+        self.snapshot_db = self.client[f"{self.db_name}_snapshot"]
+        self.collections = {}
+
+    def build(self, seed, rebuild=False):
+        """
+        Load the persisted snapshot, or seed the worker database and capture it
+        """
+        if rebuild or not self.snapshot_db.list_collection_names():
+            self.client.drop_database(self.db_name)
+            for name, indexes in SCHEMA_INDEXES.items():
+                self.db[name].create_indexes(indexes)
+            seed()
+            self._copy(self.db, self.snapshot_db)
+        self.collections = self._read(self.snapshot_db)
+
+        # Snapshots persisted before SCHEMA_INDEXES existed lack some of them
+        for name, schema in SCHEMA_INDEXES.items():
+            documents, indexes = self.collections.get(name, ([], []))
+            present = {index.document["name"] for index in indexes}
+            missing = [index for index in schema if index.document["name"] not in present]
+            self.collections[name] = (documents, indexes + missing)
+
+    def restore(self):
+        """
+        Reset the worker database to the snapshot
+        """
+        for name in self.db.list_collection_names():
+            if name not in self.collections:
+                self.db.drop_collection(name)
+
+        for name, (documents, indexes) in self.collections.items():
+            self.db.drop_collection(name)
+            collection = self.db.create_collection(name)
+            if indexes:
+                collection.create_indexes(indexes)
+            if documents:
+                collection.insert_many([dict(doc) for doc in documents])
+
+    def close(self):
+        self.client.close()
+
+    @staticmethod
+    def _read(db):
+        """
+        Return {collection: (documents, index models)} for a database
+        """
+        contents = {}
+        for name in db.list_collection_names():
+            collection = db[name]
+            indexes = []
+            for index in collection.list_indexes():
+                if index["name"] == "_id_":
+                    continue
+                options = {k: v for k, v in index.items() if k not in ("key", "v", "ns")}
+                indexes.append(IndexModel(list(index["key"].items()), **options))
+            contents[name] = (list(collection.find()), indexes)
+        return contents
+
+    def _copy(self, source, target):
+        self.client.drop_database(target.name)
+        for name, (documents, indexes) in self._read(source).items():
+            collection = target.create_collection(name)
+            if indexes:
+                collection.create_indexes(indexes)
+            if documents:
+                collection.insert_many(documents)
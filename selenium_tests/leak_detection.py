@@ -0,0 +1,52 @@
+"""
+Front-end memory sampling and growth detection for soak tests
+"""
+from performance import fit_slope
+
+
+# Maximum tolerated growth per soak iteration, after warm-up
+SLOPE_THRESHOLDS = {
+    "js_heap_bytes": 16 * 1024,
+    "dom_nodes": 2.0,
+    "event_listeners": 0.5,
+}
+
+# Units of the fitted slopes, as recorded in the performance output
+SLOPE_UNITS = {
+    "js_heap_bytes": "bytes/iteration",
+    "dom_nodes": "nodes/iteration",
+    "event_listeners": "listeners/iteration",
+}
+
+
+def sample_memory(driver):
+    """
+    Force a garbage collection and return JS heap, DOM node and listener counts
+    """
+    driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    heap = driver.execute_cdp_cmd("Runtime.getHeapUsage", {})
+    counters = driver.execute_cdp_cmd("Memory.getDOMCounters", {})
+    return {
+        "js_heap_bytes": heap["usedSize"],
+        "dom_nodes": counters["nodes"],
+        "event_listeners": counters["jsEventListeners"],
+    }
+
+
+def growth_violations(samples, thresholds=SLOPE_THRESHOLDS):
+    """
+    Fit each metric against the iteration number and report excessive growth
+
+    samples is a list of (iteration, metrics) tuples. Returns a dict of
+    metric -> slope for every metric whose slope exceeds its threshold,
+    along with all fitted slopes.
+    """
+    iterations = [iteration for iteration, _ in samples]
+    slopes = {}
+    violations = {}
+    for metric, limit in thresholds.items():
+        slope = fit_slope(iterations, [metrics[metric] for _, metrics in samples])
+        slopes[metric] = slope
+        if slope > limit:
+            violations[metric] = slope
+    return violations, slopes
@@ -0,0 +1,67 @@
+"""
+Browser network request capture from ChromeDriver's performance log
+
+Used by tests marked capture_network to count and time the requests a page
+makes, including conditional revalidations (304) and cache hits.
+"""
+import json
+
+
+def enable_network_log(chrome_options):
+    """
+    Ask ChromeDriver to log Network domain events for this session
+    """
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    prefs = chrome_options.experimental_options.get("perfLoggingPrefs")
+    if prefs is not None:
+        prefs["enableNetwork"] = True
+    else:
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True})
+
+
+def read_requests(driver, path_filter=None):
+    """
+    Drain the performance log and return one dict per completed request
+
+    Each request has url, method, status (304 for revalidations), from_cache
+    and latency_ms. Only URLs containing one of path_filter are returned.
+    """
+    requests = {}
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method", "")
+        params = message.get("params", {})
+        request_id = params.get("requestId")
+        if not method.startswith("Network.") or request_id is None:
+            continue
+
+        if method == "Network.requestWillBeSent":
+            requests[request_id] = {
+                "url": params["request"]["url"],
+                "method": params["request"]["method"],
+                "started": params["timestamp"],
+                "status": None,
+                "from_cache": False,
+                "latency_ms": None,
+            }
+            continue
+
+        request = requests.get(request_id)
+        if request is None:
+            continue
+        if method == "Network.responseReceived":
+            response = params["response"]
+            request["status"] = request["status"] or response["status"]
+            request["from_cache"] = response.get("fromDiskCache", False)
+        elif method == "Network.responseReceivedExtraInfo":
+            # The wire status: 304 here while responseReceived reports the cached 200
+            request["status"] = params["statusCode"]
+        elif method == "Network.requestServedFromCache":
+            request["from_cache"] = True
+        elif method == "Network.loadingFinished":
+            request["latency_ms"] = (params["timestamp"] - request["started"]) * 1000
+
+    completed = [r for r in requests.values() if r["latency_ms"] is not None]
+    if path_filter:
+        completed = [r for r in completed if any(path in r["url"] for path in path_filter)]
+    return completed
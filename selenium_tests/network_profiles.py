@@ -0,0 +1,74 @@
+"""
+Named network and CPU emulation profiles for the Selenium tests
+
+Profiles are applied through the Chrome DevTools Protocol so the suite can
+reproduce the conditions of campus labs on poor links instead of only
+CI-grade networking.
+"""
+
+# Throughput values are in bytes per second, latency in milliseconds.
+# -1 disables throttling for that direction (CDP convention).
+PROFILES = {
+    "none": {
+        "network": None,
+        "cpu_rate": 1,
+    },
+    "slow-3g": {
+        "network": {"latency": 2000, "download": 50000, "upload": 50000},
+        "cpu_rate": 1,
+    },
+    "fast-3g": {
+        "network": {"latency": 563, "download": 180000, "upload": 84375},
+        "cpu_rate": 1,
+    },
+    "high-latency": {
+        "network": {"latency": 600, "download": -1, "upload": -1},
+        "cpu_rate": 1,
+    },
+    "cpu-4x": {
+        "network": None,
+        "cpu_rate": 4,
+    },
+    "campus-lab": {
+        "network": {"latency": 2000, "download": 50000, "upload": 50000},
+        "cpu_rate": 4,
+    },
+}
+
+DEFAULT_PROFILE = "none"
+
+
+def parse_profiles(value):
+    """
+    Split a comma-separated list of profile names and validate each one
+    """
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise ValueError(
+            f"Unknown network profile(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(PROFILES)}"
+        )
+    return names
+
+
+def apply_profile(driver, name):
+    """
+    Apply a named profile to a Chrome WebDriver session via CDP
+    """
+    profile = PROFILES[name]
+    network = profile["network"]
+
+    if network is not None:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": network["latency"],
+            "downloadThroughput": network["download"],
+            "uploadThroughput": network["upload"],
+        })
+
+    if profile["cpu_rate"] != 1:
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {
+            "rate": profile["cpu_rate"]
+        })
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Historical performance trend store with automatic regression detection
+
+Ingests performance_results.json from every pipeline run into a local SQLite
+database keyed by commit SHA and environment, and reports change points and
+slow drifts over the last N runs.
+
+Usage:
+    python perf_trends.py ingest performance_results.json [--sha SHA] [--env ENV]
+    python perf_trends.py report [--last 20] [--env ENV] [--fail-on-regression]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+
+from performance import fit_slope
+
+
+DEFAULT_DB = os.getenv("PERF_TRENDS_DB", "perf_trends.db")
+DEFAULT_ENV = os.getenv("PERF_ENV", "local")
+
+# A step change must raise the metric by at least this fraction...
+CHANGE_THRESHOLD = 0.10
+# ...and stand out from run-to-run noise by this many pooled standard deviations
+CHANGE_MIN_SCORE = 3.0
+# Fitted increase across the whole window that counts as a slow drift
+DRIFT_THRESHOLD = 0.15
+# Runs needed on each side of a change point
+MIN_SEGMENT = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    commit_sha TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    network_profile TEXT NOT NULL,
+    value_ms REAL NOT NULL,
+    unit TEXT NOT NULL DEFAULT 'ms'
+);
+CREATE INDEX IF NOT EXISTS idx_runs_env ON runs(environment, id);
+CREATE INDEX IF NOT EXISTS idx_measurements_run ON measurements(run_id);
+"""
+
+
+def connect(path):
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    # Databases created before measurements carried a unit
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(measurements)")]
+    if "unit" not in columns:
+        connection.execute("ALTER TABLE measurements ADD COLUMN unit TEXT NOT NULL DEFAULT 'ms'")
+    return connection
+
+
+def current_sha():
+    """
+    Commit SHA of the run: GITHUB_SHA in CI, otherwise the checked-out HEAD
+    """
+    if os.getenv("GITHUB_SHA"):
+        return os.environ["GITHUB_SHA"]
+    result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True)
+    return result.stdout.strip() or "unknown"
+
+
+def ingest(connection, records, commit_sha, environment):
+    """
+    Store one run's performance records and return the new run id
+
+    Every record of a test that did not pass is left out: a failed or
+    errored test's timings measure the failure, not the code under test.
+    """
+    failed = {r["test"] for r in records if r.get("outcome", "passed") != "passed"}
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (commit_sha, environment, created_at) VALUES (?, ?, ?)",
+            (commit_sha, environment, time.time())
+        )
+        run_id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO measurements (run_id, test, metric, network_profile, value_ms, unit) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, r["test"], r["metric"], r.get("network_profile", "none"), r["value_ms"],
+                 r.get("unit", "ms"))
+                for r in records if r["test"] not in failed
+            ]
+        )
+    return run_id
+
+
+def load_series(connection, environment, last):
+    """
+    Return {(test, metric, network_profile, unit): [(commit_sha, median value)]}
+
+    Series are ordered oldest to newest over the last N runs of an environment.
+    """
+    runs = connection.execute(
+        "SELECT id, commit_sha FROM runs WHERE environment = ? ORDER BY id DESC LIMIT ?",
+        (environment, last)
+    ).fetchall()
+    runs.reverse()
+    if not runs:
+        return {}
+
+    placeholders = ",".join("?" * len(runs))
+    rows = connection.execute(
+        f"SELECT run_id, test, metric, network_profile, value_ms, unit FROM measurements "
+        f"WHERE run_id IN ({placeholders})",
+        [run_id for run_id, _ in runs]
+    ).fetchall()
+
+    values = {}
+    for run_id, test, metric, profile, value, unit in rows:
+        values.setdefault((test, metric, profile, unit), {}).setdefault(run_id, []).append(value)
+
+    series = {}
+    for key, by_run in values.items():
+        series[key] = [
+            (sha, statistics.median(by_run[run_id]))
+            for run_id, sha in runs if run_id in by_run
+        ]
+    return series
+
+
+def detect_change_point(values):
+    """
+    Find the split with the largest upward step in the mean
+
+    Returns (index, relative change) when the step is large and clearly above
+    noise, otherwise None. index is the first run after the change.
+    """
+    best = None
+    for k in range(MIN_SEGMENT, len(values) - MIN_SEGMENT + 1):
+        before, after = values[:k], values[k:]
+        mean_before, mean_after = statistics.mean(before), statistics.mean(after)
+        if mean_before <= 0 or mean_after <= mean_before:
+            continue
+        pooled_variance = (
+            statistics.pvariance(before) * len(before) + statistics.pvariance(after) * len(after)
+        ) / len(values)
+        spread = pooled_variance ** 0.5 or 1e-9
+        score = (mean_after - mean_before) / spread
+        change = (mean_after - mean_before) / mean_before
+        if change >= CHANGE_THRESHOLD and score >= CHANGE_MIN_SCORE:
+            if best is None or score > best[2]:
+                best = (k, change, score)
+    return best[:2] if best else None
+
+
+def detect_drift(values):
+    """
+    Return the fitted relative increase across the window if it is a slow drift
+    """
+    if len(values) < 2 * MIN_SEGMENT:
+        return None
+    slope = fit_slope(list(range(len(values))), values)
+    start = statistics.mean(values[:MIN_SEGMENT])
+    if start <= 0:
+        return None
+    increase = slope * (len(values) - 1) / start
+    return increase if increase >= DRIFT_THRESHOLD else None
+
+
+def step_error(values, index):
+    """
+    Squared error of a two-level step model split at index
+    """
+    error = 0.0
+    for segment in (values[:index], values[index:]):
+        mean = statistics.mean(segment)
+        error += sum((v - mean) ** 2 for v in segment)
+    return error
+
+
+def linear_error(values):
+    """
+    Squared error of a least-squares line through the values
+    """
+    xs = list(range(len(values)))
+    slope = fit_slope(xs, values)
+    intercept = statistics.mean(values) - slope * statistics.mean(xs)
+    return sum((v - (intercept + slope * x)) ** 2 for x, v in zip(xs, values))
+
+
+def analyze(series):
+    """
+    Return a list of findings, one per regressed series
+
+    When both a change point and a drift are detected, the model that fits
+    the series better decides how the regression is reported.
+    """
+    findings = []
+    for (test, metric, profile, unit), points in sorted(series.items()):
+        values = [value for _, value in points]
+        change = detect_change_point(values)
+        drift = detect_drift(values)
+        if change and drift and linear_error(values) < step_error(values, change[0]):
+            change = None
+
+        if change:
+            index, relative = change
+            findings.append({
+                "test": test, "metric": metric, "network_profile": profile,
+                "kind": "change point", "change": relative,
+                "commit_sha": points[index][0], "latest": values[-1], "unit": unit,
+            })
+        elif drift:
+            findings.append({
+                "test": test, "metric": metric, "network_profile": profile,
+                "kind": "drift", "change": drift,
+                "commit_sha": points[0][0], "latest": values[-1], "unit": unit,
+            })
+    return findings
+
+
+def format_report(findings, series, environment, last):
+    lines = [
+        f"Performance trends for '{environment}' over the last {last} runs: "
+        f"{len(series)} series, {len(findings)} regression(s)"
+    ]
+    for f in findings:
+        since = "at" if f["kind"] == "change point" else "since"
+        lines.append(
+            f"  {f['kind']:<12} +{f['change'] * 100:5.1f}%  {f['latest']:9.1f} {f['unit']:<5}  "
+            f"{f['test']} [{f['metric']}, {f['network_profile']}] "
+            f"{since} {f['commit_sha'][:10]}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Performance trend store")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="Store a run's performance results")
+    ingest_parser.add_argument("results", help="performance_results.json to ingest")
+    ingest_parser.add_argument("--sha", default=None, help="Commit SHA (default: GITHUB_SHA or git HEAD)")
+    ingest_parser.add_argument("--env", default=DEFAULT_ENV, help="Environment name")
+
+    report_parser = commands.add_parser("report", help="Report regressions over recent runs")
+    report_parser.add_argument("--last", type=int, default=20, help="Number of runs to analyze")
+    report_parser.add_argument("--env", default=DEFAULT_ENV, help="Environment name")
+    report_parser.add_argument("--fail-on-regression", action="store_true",
+                               help="Exit with status 1 when a regression is found")
+
+    args = parser.parse_args()
+    connection = connect(args.db)
+
+    if args.command == "ingest":
+        with open(args.results, encoding="utf-8") as f:
+            records = json.load(f)["records"]
+        run_id = ingest(connection, records, args.sha or current_sha(), args.env)
+        print(f"Ingested {len(records)} measurements as run {run_id}")
+        return
+
+    series = load_series(connection, args.env, args.last)
+    findings = analyze(series)
+    print(format_report(findings, series, args.env, args.last))
+    if findings and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Collection of performance timings recorded during the Selenium tests
+"""
+import json
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+
+NAVIGATION_TIMING_SCRIPT = """
+    const [entry] = performance.getEntriesByType('navigation');
+    return entry ? {
+        dom_content_loaded: entry.domContentLoadedEventEnd,
+        page_load: entry.loadEventEnd
+    } : null;
+"""
+
+
+def navigation_timing(driver):
+    """
+    Return page-load milestones (ms since navigation start) of the current page
+
+    Returns {} when the page cannot be queried (open alert, dead session).
+    """
+    try:
+        return driver.execute_script(NAVIGATION_TIMING_SCRIPT) or {}
+    except WebDriverException:
+        return {}
+
+
+def fit_slope(xs, ys):
+    """
+    Least-squares slope of ys over xs
+    """
+    n = len(xs)
+    if n < 2:
+        return 0.0
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    if denominator == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
+
+
+class PerformanceRecorder:
+    """
+    Accumulates timing records for the whole session and writes them as JSON
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, test, metric, value_ms, **context):
+        """
+        Store a single measurement in milliseconds
+
+        Measurements that are not durations pass their unit in the context,
+        e.g. unit="count"; value_ms then holds a value in that unit.
+        """
+        entry = {"test": test, "metric": metric, "value_ms": round(value_ms, 2)}
+        entry.update(context)
+        self.records.append(entry)
+
+    @contextmanager
+    def measure(self, test, metric, **context):
+        """
+        Time the body of a with-block and record it as one measurement
+
+        The record carries wall-clock start/end so resource samples can be
+        lined up with it. Nothing is recorded when the body raises: a failed
+        wait would otherwise be stored as a timing equal to its timeout.
+        """
+        wall_start = time.time()
+        start = time.perf_counter()
+        yield
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.record(test, metric, elapsed_ms, start=wall_start, end=time.time(), **context)
+
+    def write(self, path):
+        """
+        Write all records to a JSON file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"records": self.records}, f, indent=2)
+
+
+class TestTimer:
+    """
+    Per-test handle onto the session recorder
+
+    Fills in the test name and active emulation profile automatically.
+    """
+    __test__ = False
+
+    def __init__(self, recorder, test, network_profile):
+        self.recorder = recorder
+        self.test = test
+        self.network_profile = network_profile
+
+    def record(self, metric, value_ms, **context):
+        self.recorder.record(self.test, metric, value_ms,
+                             network_profile=self.network_profile, **context)
+
+    def measure(self, metric):
+        return self.recorder.measure(self.test, metric,
+                                     network_profile=self.network_profile)
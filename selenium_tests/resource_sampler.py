@@ -0,0 +1,236 @@
+"""
+Backend resource sampler correlated with test timelines
+
+Samples CPU, RSS, open file descriptors and socket count of the backend and
+mongod processes at high frequency, plus Node event-loop lag from a probe,
+and lines the samples up with timed records: test durations and named
+timings from performance_results.json, or write_benchmark.py load phases.
+Both run_tests.py and write_benchmark.py take the sampler options below.
+"""
+import json
+import os
+import subprocess
+import threading
+import time
+import urllib.request
+
+import psutil
+
+
+def resolve_pid(target, match=None):
+    """
+    Resolve a PID or Docker container name/ID to the host PID to sample
+
+    A container's PID 1 is often an init wrapper (the backend image runs
+    dumb-init), so the process is picked from the target and its descendants:
+    the first whose executable name contains match. The wrapper's own command
+    line names its child, so only the name is compared.
+    """
+    if target.isdigit():
+        pid = int(target)
+    else:
+        result = subprocess.run(
+            ["docker", "inspect", "-f", "{{.State.Pid}}", target],
+            capture_output=True, text=True, check=True
+        )
+        pid = int(result.stdout.strip())
+    if not match:
+        return pid
+
+    root = psutil.Process(pid)
+    for process in [root] + root.children(recursive=True):
+        if match in process.name():
+            return process.pid
+    raise ValueError(f"No process matching '{match}' in {target} (pid {pid})")
+
+
+def open_descriptors(process):
+    """
+    Open file descriptors of a process, or open handles on Windows (no num_fds there)
+    """
+    if os.name == "nt":
+        return process.num_handles()
+    return process.num_fds()
+
+
+def add_sampler_arguments(parser, timeline_output="resource_timeline.json"):
+    """
+    Add the options that select processes to sample and the timeline output
+    """
+    parser.add_argument("--sample-backend", help="PID or container of the backend to sample")
+    parser.add_argument("--sample-backend-match", default="node",
+                        help="Sample the backend process whose executable name contains this, "
+                             "skipping init wrappers such as dumb-init (default: node)")
+    parser.add_argument("--sample-mongod", help="PID or container of mongod to sample")
+    parser.add_argument("--sample-mongod-match", default="mongod",
+                        help="Sample the mongod process whose executable name contains this "
+                             "(default: mongod)")
+    parser.add_argument("--sample-interval", type=float, default=0.1,
+                        help="Seconds between resource samples (default: 0.1)")
+    parser.add_argument("--probe-url", default=os.getenv("BACKEND_URL", "http://localhost:3000") + "/health",
+                        help="Backend URL timed to estimate event-loop lag")
+    parser.add_argument("--timeline-output", default=timeline_output,
+                        help=f"Path of the resource timeline JSON file (default: {timeline_output})")
+
+
+def start_sampler(args):
+    """
+    Start a sampler for the processes selected in args, or return None
+    """
+    targets = {}
+    if args.sample_backend:
+        targets["backend"] = resolve_pid(args.sample_backend, args.sample_backend_match)
+    if args.sample_mongod:
+        targets["mongod"] = resolve_pid(args.sample_mongod, args.sample_mongod_match)
+    if not targets:
+        return None
+
+    sampler = ResourceSampler(
+        targets,
+        interval=args.sample_interval,
+        probe_url=args.probe_url if args.sample_backend else None
+    )
+    sampler.start()
+    print(f"Sampling resources of: {', '.join(f'{k} (pid {v})' for k, v in targets.items())}")
+    return sampler
+
+
+def stop_sampler(sampler, args, records):
+    """
+    Stop the sampler and export its samples aligned with the timed records
+    """
+    sampler.stop()
+    for name, reasons in sampler.skipped.items():
+        counts = ", ".join(f"{reason} x{count}" for reason, count in reasons.items())
+        print(f"Warning: skipped samples of {name}: {counts}")
+    write_timeline(args.timeline_output, sampler, records)
+    print(f"Resource timeline written to: {args.timeline_output}")
+
+
+class ResourceSampler:
+    """
+    Background sampler for a set of named processes
+
+    The event-loop probe times GET /health on the backend. That handler does
+    no I/O, so its delay beyond a baseline round trip is time spent waiting
+    for the Node event loop. Processes that exit or cannot be read are
+    counted per reason in skipped instead of stopping the sampler.
+    """
+
+    def __init__(self, targets, interval=0.1, probe_url=None, probe_interval=0.5):
+        self.processes = {name: psutil.Process(pid) for name, pid in targets.items()}
+        self.interval = interval
+        self.probe_url = probe_url
+        self.probe_interval = probe_interval
+        self.samples = []
+        self.probes = []
+        self.skipped = {}
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        # The first cpu_percent() call only primes the counter
+        for process in self.processes.values():
+            process.cpu_percent(None)
+        self._threads = [threading.Thread(target=self._sample_loop, daemon=True)]
+        if self.probe_url:
+            self._threads.append(threading.Thread(target=self._probe_loop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _sample_loop(self):
+        while not self._stop.is_set():
+            timestamp = time.time()
+            for name, process in self.processes.items():
+                try:
+                    with process.oneshot():
+                        self.samples.append({
+                            "time": timestamp,
+                            "process": name,
+                            "cpu_percent": process.cpu_percent(None),
+                            "rss_bytes": process.memory_info().rss,
+                            "open_fds": open_descriptors(process),
+                            "sockets": len(process.connections(kind="inet")),
+                        })
+                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                    reasons = self.skipped.setdefault(name, {})
+                    reasons[type(e).__name__] = reasons.get(type(e).__name__, 0) + 1
+            self._stop.wait(self.interval)
+
+    def _probe_loop(self):
+        baseline = None
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            try:
+                urllib.request.urlopen(self.probe_url, timeout=5).close()
+            except OSError:
+                self._stop.wait(self.probe_interval)
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            baseline = elapsed_ms if baseline is None else min(baseline, elapsed_ms)
+            self.probes.append({
+                "time": time.time(),
+                "process": "backend",
+                "event_loop_lag_ms": round(elapsed_ms - baseline, 2),
+            })
+            self._stop.wait(self.probe_interval)
+
+
+def correlate(samples, probes, records):
+    """
+    Summarize the samples taken during each timed test, named timing or load phase
+
+    Records without start/end timestamps are skipped, and a phase reported by
+    several records (p50/p90/p99 of one load step) is summarized once.
+    """
+    steps = []
+    seen = set()
+    for record in records:
+        if "start" not in record or "end" not in record:
+            continue
+        window = [s for s in samples if record["start"] <= s["time"] <= record["end"]]
+        lags = [p["event_loop_lag_ms"] for p in probes
+                if record["start"] <= p["time"] <= record["end"]]
+        step = {
+            "step": record.get("phase") or (
+                record["test"] if record["metric"] == "duration"
+                else f"{record['test']} [{record['metric']}]"
+            ),
+            "start": record["start"],
+            "end": record["end"],
+            "processes": {},
+            "max_event_loop_lag_ms": max(lags) if lags else None,
+        }
+        key = (step["step"], step["start"], step["end"])
+        if key in seen:
+            continue
+        seen.add(key)
+        for name in sorted({s["process"] for s in window}):
+            mine = [s for s in window if s["process"] == name]
+            step["processes"][name] = {
+                "max_cpu_percent": max(s["cpu_percent"] for s in mine),
+                "max_rss_bytes": max(s["rss_bytes"] for s in mine),
+                "rss_growth_bytes": mine[-1]["rss_bytes"] - mine[0]["rss_bytes"],
+                "max_open_fds": max(s["open_fds"] for s in mine),
+                "max_sockets": max(s["sockets"] for s in mine),
+            }
+        steps.append(step)
+    return steps
+
+
+def write_timeline(path, sampler, records):
+    """
+    Export raw samples, probes and per-test correlation as one JSON file
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "samples": sampler.samples,
+            "probes": sampler.probes,
+            "skipped": sampler.skipped,
+            "steps": correlate(sampler.samples, sampler.probes, records),
+        }, f, indent=2)
@@ -2,35 +2,96 @@
 """
 Script to run Selenium tests with proper configuration
 """
+import argparse
+import json
 import sys
 import subprocess
 import os
 
+from resource_sampler import add_sampler_arguments, start_sampler, stop_sampler
+
+
+# Extra pytest arguments per execution tier
+TIERS = {
+    "smoke": ["-m", "smoke", "-x"],
+    "regression": ["-m", "not smoke"],
+    "full": ["--tiered"],
+}
+
+
+def parse_args():
+    """
+    Parse runner options; everything else is passed through to pytest
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--tier", choices=sorted(TIERS),
+                        help="smoke: fail-fast smoke tier only; regression: everything but smoke; "
+                             "full: smoke first, regression only if smoke passes")
+    add_sampler_arguments(parser)
+    parser.add_argument("--perf-output", default="performance_results.json")
+    parser.add_argument("--trend-db", help="Ingest the performance output into this trend database")
+    parser.add_argument("--trend-env", default=os.getenv("PERF_ENV", "local"),
+                        help="Environment name recorded in the trend database")
+    return parser.parse_known_args()
+
+
+def read_records(path):
+    """
+    Records of the performance output, or [] when the run produced none
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["records"]
+
+
+def ingest_trends(args):
+    """
+    Add this run's performance output to the historical trend store
+    """
+    import perf_trends
+
+    if not os.path.exists(args.perf_output):
+        return
+    with open(args.perf_output, encoding="utf-8") as f:
+        records = json.load(f)["records"]
+    connection = perf_trends.connect(args.trend_db)
+    run_id = perf_trends.ingest(connection, records, perf_trends.current_sha(), args.trend_env)
+    connection.close()
+    print(f"Performance results stored as run {run_id} in: {args.trend_db}")
+
 
 def main():
     """
     Run pytest with HTML report generation
     """
+    args, pytest_args = parse_args()
+
     # Set default BASE_URL if not provided
     if "BASE_URL" not in os.environ:
         os.environ["BASE_URL"] = "http://localhost"
-    
+
     print(f"Running Selenium tests against: {os.environ['BASE_URL']}")
     print("-" * 60)
-    
+
     # Run pytest with HTML report
     cmd = [
         "pytest",
         "-v",
         "--html=test_report.html",
         "--self-contained-html",
-        "--tb=short"
+        "--tb=short",
+        f"--perf-output={args.perf_output}"
     ]
-    
+
+    if args.tier:
+        print(f"Execution tier: {args.tier}")
+        cmd.extend(TIERS[args.tier])
+
     # Add any additional arguments passed to this script
-    if len(sys.argv) > 1:
-        cmd.extend(sys.argv[1:])
-    
+    cmd.extend(pytest_args)
+
+    sampler = start_sampler(args)
     try:
         result = subprocess.run(cmd, check=False)
         sys.exit(result.returncode)
@@ -41,6 +102,11 @@ def main():
     except KeyboardInterrupt:
         print("\nTests interrupted by user")
         sys.exit(130)
+    finally:
+        if sampler is not None:
+            stop_sampler(sampler, args, read_records(args.perf_output))
+        if args.trend_db:
+            ingest_trends(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+"""
+Static asset size, compression and caching budget tests
+"""
+import pytest
+
+from asset_budgets import check_served, check_sizes, served_assets
+
+pytestmark = pytest.mark.regression
+
+
+@pytest.mark.parametrize("asset", served_assets())
+def test_asset_within_size_budget(asset):
+    """
+    Test that each served asset has a budget and its raw and gzip sizes stay within it
+    """
+    problems = check_sizes(asset)
+    assert not problems, "\n".join(problems)
+
+
+@pytest.mark.parametrize("asset", served_assets())
+def test_asset_served_compressed_and_cacheable(base_url, asset):
+    """
+    Test that each asset is served compressed, with cache headers and 304 revalidation
+    """
+    problems = check_served(base_url, asset)
+    assert not problems, "\n".join(problems)
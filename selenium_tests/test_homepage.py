@@ -7,6 +7,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+pytestmark = pytest.mark.regression
+
 
 def test_homepage_loads_successfully(driver, base_url):
     """
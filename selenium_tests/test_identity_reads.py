@@ -0,0 +1,155 @@
+"""
+Identity Read Path: latency, request count and cache validation
+
+Measures the /api/auth/me and /api/users/profile reads made across realistic
+navigation sequences, checks that conditional requests (ETag/If-None-Match)
+turn repeat reads into 304s, and reports redundant identity calls per session: round-trips beyond the one
+each full page load genuinely needs.
+"""
+import http.cookiejar
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from data_lifecycle import register_user
+from network_capture import read_requests
+
+pytestmark = [pytest.mark.regression, pytest.mark.profile]
+
+IDENTITY_ENDPOINTS = ("/api/auth/me", "/api/users/profile")
+
+# Repeat reads per endpoint when comparing full and conditional responses
+REPEATS = 20
+
+# Navigation sequences: ("tab", name) switches SPA tabs, ("reload",) reloads the page
+NAVIGATION_SEQUENCES = {
+    "tab_tour": [("tab", "students"), ("tab", "profile"), ("tab", "home"), ("tab", "profile")],
+    "profile_revisit": [("tab", "profile"), ("tab", "students"), ("tab", "profile")],
+    "reload_session": [("tab", "profile"), ("reload",), ("tab", "students"), ("reload",), ("reload",)],
+}
+
+
+def api_session(base_url, user):
+    """
+    urllib opener holding an authenticated session cookie
+    """
+    register_user(base_url, user)
+    opener = urllib.request.build_opener(
+        urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+    )
+    request = urllib.request.Request(
+        f"{base_url}/api/auth/login",
+        data=json.dumps({"username": user["username"], "password": user["password"]}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    opener.open(request, timeout=10).close()
+    return opener
+
+
+def timed_get(opener, url, headers=None):
+    """
+    GET a URL and return (status, headers, body length, latency in ms)
+    """
+    request = urllib.request.Request(url, headers=headers or {})
+    start = time.perf_counter()
+    try:
+        with opener.open(request, timeout=10) as response:
+            status, response_headers, body = response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        status, response_headers, body = e.code, e.headers, e.read()
+    return status, response_headers, len(body), (time.perf_counter() - start) * 1000
+
+
+def run_sequence(driver, steps):
+    """
+    Perform a navigation sequence and return the number of page reloads
+    """
+    reloads = 0
+    for step in steps:
+        if step[0] == "tab":
+            driver.find_element(By.CSS_SELECTOR, f".nav-tab[data-tab='{step[1]}']").click()
+            WebDriverWait(driver, 10).until(
+                EC.visibility_of_element_located((By.ID, f"{step[1]}Tab"))
+            )
+        else:
+            driver.refresh()
+            reloads += 1
+        WebDriverWait(driver, 10).until(
+            EC.visibility_of_element_located((By.ID, "navbar"))
+        )
+    return reloads
+
+
+@pytest.mark.parametrize("endpoint", IDENTITY_ENDPOINTS)
+def test_identity_conditional_requests(base_url, test_user, perf, endpoint):
+    """
+    Test that identity reads support ETag revalidation
+
+    Steps:
+    1. Read the endpoint and verify it returns an ETag
+    2. Repeat the read with If-None-Match and verify 304 with an empty body
+    3. Compare full and conditional latency
+    """
+    opener = api_session(base_url, test_user)
+    url = f"{base_url}{endpoint}"
+
+    status, headers, _, _ = timed_get(opener, url)
+    assert status == 200, f"{endpoint} should return 200, got {status}"
+    etag = headers.get("ETag")
+    assert etag, f"{endpoint} should return an ETag"
+
+    full, conditional = [], []
+    for _ in range(REPEATS):
+        full.append(timed_get(opener, url)[3])
+        status, _, length, latency = timed_get(opener, url, {"If-None-Match": etag})
+        assert status == 304, f"{endpoint} with matching If-None-Match should return 304, got {status}"
+        assert length == 0, "304 response should not carry a body"
+        conditional.append(latency)
+
+    perf.record("full_p50", statistics.median(full))
+    perf.record("conditional_p50", statistics.median(conditional))
+
+
+@pytest.mark.capture_network
+@pytest.mark.parametrize("sequence", list(NAVIGATION_SEQUENCES))
+def test_identity_reads_per_navigation_sequence(logged_in_driver, perf, sequence):
+    """
+    Test identity round-trips during a realistic navigation sequence
+
+    Steps:
+    1. Start on the dashboard with an authenticated session
+    2. Switch tabs and reload as in the sequence
+    3. Count identity round-trips, revalidations and cache hits
+    4. Verify only full page reloads read the identity again, never tab switches
+    """
+    driver = logged_in_driver
+    # Discard the login and initial dashboard load; every identity read after it repeats a known answer
+    read_requests(driver)
+
+    reloads = run_sequence(driver, NAVIGATION_SEQUENCES[sequence])
+    requests = read_requests(driver, IDENTITY_ENDPOINTS)
+
+    round_trips = [r for r in requests if not r["from_cache"] or r["status"] == 304]
+    revalidated = [r for r in requests if r["status"] == 304]
+
+    # Every page reload legitimately reads the identity once
+    redundant = max(0, len(round_trips) - reloads)
+    perf.record(f"identity_redundant@{sequence}", redundant, unit="count")
+    perf.record(f"identity_revalidated@{sequence}", len(revalidated), unit="count")
+    perf.record(f"identity_cached@{sequence}", len(requests) - len(round_trips), unit="count")
+    if round_trips:
+        perf.record(f"identity_p50@{sequence}",
+                    statistics.median(r["latency_ms"] for r in round_trips))
+
+    assert redundant == 0, (
+        f"Tab switches should reuse the loaded identity: {len(round_trips)} identity "
+        f"round-trips for {reloads} page reloads"
+    )
@@ -8,8 +8,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
+from data_lifecycle import register_user
 
-def test_successful_login(driver, base_url, test_user):
+pytestmark = [pytest.mark.regression, pytest.mark.login]
+
+
+def test_successful_login(driver, base_url, test_user, perf):
     """
     Test Case 2: Successful Login Test
     
@@ -21,31 +25,8 @@ def test_successful_login(driver, base_url, test_user):
     5. Verify navigation bar is present
     6. Verify user is authenticated
     """
-    # First, register the test user
-    driver.get(f"{base_url}/login.html")
-    
-    # Switch to registration form
-    register_link = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.LINK_TEXT, "Register here"))
-    )
-    register_link.click()
-    
-    # Fill registration form
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "registerForm"))
-    )
-    
-    driver.find_element(By.ID, "registerUsername").send_keys(test_user["username"])
-    driver.find_element(By.ID, "registerEmail").send_keys(test_user["email"])
-    driver.find_element(By.ID, "registerPassword").send_keys(test_user["password"])
-    driver.find_element(By.ID, "registerFullName").send_keys(test_user["fullName"])
-    
-    # Submit registration
-    register_button = driver.find_element(By.CSS_SELECTOR, "#registerForm button[type='submit']")
-    register_button.click()
-    
-    # Wait for redirect or success message
-    time.sleep(2)
+    # The test user is registered through the API; only the login goes through the UI
+    register_user(base_url, test_user)
     
     # Now perform login
     driver.get(f"{base_url}/login.html")
@@ -61,13 +42,13 @@ def test_successful_login(driver, base_url, test_user):
     
     # Click login button
     login_button = driver.find_element(By.CSS_SELECTOR, "#loginForm button[type='submit']")
-    login_button.click()
-    
-    # Verify redirect to dashboard (index.html)
-    WebDriverWait(driver, 10).until(
-        EC.url_contains("index.html")
-    )
-    assert "index.html" in driver.current_url, "Should redirect to index.html after login"
+    # Verify redirect to the dashboard, timing until it is shown for the user
+    with perf.measure("login_redirect"):
+        login_button.click()
+        WebDriverWait(driver, 10).until(
+            EC.visibility_of_element_located((By.ID, "navbar"))
+        )
+    assert "login.html" not in driver.current_url, "Should redirect to the dashboard after login"
     
     # Verify navigation bar is present
     nav_bar = WebDriverWait(driver, 10).until(
@@ -76,16 +57,16 @@ def test_successful_login(driver, base_url, test_user):
     assert nav_bar.is_displayed(), "Navigation bar should be visible"
     
     # Verify navigation tabs are present
-    home_tab = driver.find_element(By.CSS_SELECTOR, "a[data-tab='home']")
-    students_tab = driver.find_element(By.CSS_SELECTOR, "a[data-tab='students']")
-    profile_tab = driver.find_element(By.CSS_SELECTOR, "a[data-tab='profile']")
+    home_tab = driver.find_element(By.CSS_SELECTOR, ".nav-tab[data-tab='home']")
+    students_tab = driver.find_element(By.CSS_SELECTOR, ".nav-tab[data-tab='students']")
+    profile_tab = driver.find_element(By.CSS_SELECTOR, ".nav-tab[data-tab='profile']")
     
     assert home_tab.is_displayed(), "Home tab should be visible"
     assert students_tab.is_displayed(), "Students tab should be visible"
     assert profile_tab.is_displayed(), "Profile tab should be visible"
     
     # Verify user is authenticated by checking for logout button
-    logout_button = driver.find_element(By.ID, "logoutBtn")
+    logout_button = driver.find_element(By.CSS_SELECTOR, ".btn-logout")
     assert logout_button.is_displayed(), "Logout button should be visible for authenticated user"
 
 
@@ -8,55 +8,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
-
-def register_and_login(driver, base_url, test_user):
-    """
-    Helper function to register and login a user
-    """
-    driver.get(f"{base_url}/login.html")
-    
-    # Switch to registration form
-    register_link = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.LINK_TEXT, "Register here"))
-    )
-    register_link.click()
-    
-    # Fill registration form
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "registerForm"))
-    )
-    
-    driver.find_element(By.ID, "registerUsername").send_keys(test_user["username"])
-    driver.find_element(By.ID, "registerEmail").send_keys(test_user["email"])
-    driver.find_element(By.ID, "registerPassword").send_keys(test_user["password"])
-    driver.find_element(By.ID, "registerFullName").send_keys(test_user["fullName"])
-    
-    # Submit registration
-    register_button = driver.find_element(By.CSS_SELECTOR, "#registerForm button[type='submit']")
-    register_button.click()
-    
-    time.sleep(2)
-    
-    # Login
-    driver.get(f"{base_url}/login.html")
-    
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "loginForm"))
-    )
-    
-    driver.find_element(By.ID, "loginUsername").send_keys(test_user["username"])
-    driver.find_element(By.ID, "loginPassword").send_keys(test_user["password"])
-    
-    login_button = driver.find_element(By.CSS_SELECTOR, "#loginForm button[type='submit']")
-    login_button.click()
-    
-    # Wait for redirect to dashboard
-    WebDriverWait(driver, 10).until(
-        EC.url_contains("index.html")
-    )
+pytestmark = [pytest.mark.regression, pytest.mark.navigation]
 
 
-def test_navigation_tabs(driver, base_url, test_user):
+def test_navigation_tabs(logged_in_driver):
     """
     Test Case 5: Navigation Test
     
@@ -66,8 +21,8 @@ def test_navigation_tabs(driver, base_url, test_user):
     3. Verify correct content is displayed for each tab
     4. Verify active tab is highlighted
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Test Home tab
     home_tab = WebDriverWait(driver, 10).until(
@@ -133,12 +88,12 @@ def test_navigation_tabs(driver, base_url, test_user):
     assert not students_section.is_displayed(), "Students section should be hidden"
 
 
-def test_navigation_persistence(driver, base_url, test_user):
+def test_navigation_persistence(logged_in_driver):
     """
     Test that navigation state persists correctly
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Navigate to Students tab
     students_tab = WebDriverWait(driver, 10).until(
@@ -165,12 +120,12 @@ def test_navigation_persistence(driver, base_url, test_user):
     assert home_section.is_displayed(), "Home section should be visible after navigating back"
 
 
-def test_all_navigation_elements_present(driver, base_url, test_user):
+def test_all_navigation_elements_present(logged_in_driver):
     """
     Test that all navigation elements are present and clickable
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Verify all navigation tabs are present
     home_tab = WebDriverWait(driver, 10).until(
@@ -0,0 +1,140 @@
+"""
+Regression detection in the performance trend store, on synthetic series
+"""
+import sqlite3
+
+import pytest
+
+import perf_trends
+
+pytestmark = pytest.mark.regression
+
+# Run-to-run noise of about +/-3% around a flat 100 ms
+FLAT_NOISE = [100, 103, 98, 101, 97, 102, 99, 103, 98, 100, 102, 97]
+
+
+def as_series(values, unit="ms"):
+    """
+    One test/metric series with a commit SHA per run
+    """
+    return {("test_x", "duration", "none", unit): [(f"sha{i}", v) for i, v in enumerate(values)]}
+
+
+def test_compounding_drift_reported_as_drift():
+    """
+    Test that a 5% slowdown per run is reported as a drift, not a step
+    """
+    values = [100 * 1.05 ** i for i in range(12)]
+
+    findings = perf_trends.analyze(as_series(values))
+
+    assert len(findings) == 1
+    assert findings[0]["kind"] == "drift"
+    assert findings[0]["commit_sha"] == "sha0"
+    assert findings[0]["change"] >= perf_trends.DRIFT_THRESHOLD
+
+
+def test_single_step_reported_at_its_commit():
+    """
+    Test that a 30% step is reported as a change point at the first slow run
+    """
+    values = [v * (1.3 if i >= 6 else 1) for i, v in enumerate(FLAT_NOISE)]
+
+    findings = perf_trends.analyze(as_series(values))
+
+    assert len(findings) == 1
+    assert findings[0]["kind"] == "change point"
+    assert findings[0]["commit_sha"] == "sha6"
+    assert findings[0]["change"] == pytest.approx(0.3, abs=0.03)
+
+
+def test_flat_noise_not_reported():
+    """
+    Test that run-to-run noise without a trend produces no findings
+    """
+    assert perf_trends.detect_change_point(FLAT_NOISE) is None
+    assert perf_trends.detect_drift(FLAT_NOISE) is None
+    assert perf_trends.analyze(as_series(FLAT_NOISE)) == []
+
+
+def test_improvement_not_reported():
+    """
+    Test that a step down (faster) is not a regression
+    """
+    values = [v * (0.7 if i >= 6 else 1) for i, v in enumerate(FLAT_NOISE)]
+
+    assert perf_trends.analyze(as_series(values)) == []
+
+
+def test_ingest_skips_records_of_failed_tests(tmp_path):
+    """
+    Test that every record of a test that did not pass is left out
+    """
+    connection = perf_trends.connect(str(tmp_path / "trends.db"))
+    records = [
+        {"test": "test_ok", "metric": "duration", "value_ms": 10.0, "outcome": "passed"},
+        {"test": "test_ok", "metric": "page_load", "value_ms": 20.0},
+        {"test": "test_failed", "metric": "duration", "value_ms": 10000.0, "outcome": "failed"},
+        {"test": "test_failed", "metric": "page_load", "value_ms": 30.0},
+        {"test": "write_benchmark", "metric": "p50@10rps", "value_ms": 5.0},
+    ]
+
+    perf_trends.ingest(connection, records, "abc", "ci")
+
+    stored = connection.execute("SELECT test, metric FROM measurements ORDER BY test, metric").fetchall()
+    assert stored == [
+        ("test_ok", "duration"), ("test_ok", "page_load"), ("write_benchmark", "p50@10rps"),
+    ]
+
+
+def test_units_stored_and_series_kept_apart(tmp_path):
+    """
+    Test that a record's unit is stored, defaults to ms and is part of the series
+    """
+    connection = perf_trends.connect(str(tmp_path / "trends.db"))
+    perf_trends.ingest(connection, [
+        {"test": "test_x", "metric": "identity_redundant@tab_tour", "value_ms": 2, "unit": "count"},
+        {"test": "test_x", "metric": "duration", "value_ms": 100.0},
+    ], "abc", "ci")
+
+    series = perf_trends.load_series(connection, "ci", 20)
+
+    assert set(series) == {
+        ("test_x", "identity_redundant@tab_tour", "none", "count"),
+        ("test_x", "duration", "none", "ms"),
+    }
+
+
+def test_connect_migrates_database_without_unit(tmp_path):
+    """
+    Test that a database created before units gets the column, defaulting to ms
+    """
+    path = str(tmp_path / "old.db")
+    old = sqlite3.connect(path)
+    old.executescript("""
+        CREATE TABLE runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            commit_sha TEXT NOT NULL,
+            environment TEXT NOT NULL,
+            created_at REAL NOT NULL
+        );
+        CREATE TABLE measurements (
+            run_id INTEGER NOT NULL REFERENCES runs(id),
+            test TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            network_profile TEXT NOT NULL,
+            value_ms REAL NOT NULL
+        );
+        INSERT INTO runs (commit_sha, environment, created_at) VALUES ('old', 'ci', 0);
+        INSERT INTO measurements VALUES (1, 'test_x', 'duration', 'none', 100.0);
+    """)
+    old.commit()
+    old.close()
+
+    connection = perf_trends.connect(path)
+    perf_trends.ingest(connection, [
+        {"test": "test_x", "metric": "duration", "value_ms": 110.0, "outcome": "passed"},
+    ], "new", "ci")
+
+    series = perf_trends.load_series(connection, "ci", 20)
+    assert series == {("test_x", "duration", "none", "ms"): [("old", 100.0), ("new", 110.0)]}
@@ -8,55 +8,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
-
-def register_and_login(driver, base_url, test_user):
-    """
-    Helper function to register and login a user
-    """
-    driver.get(f"{base_url}/login.html")
-    
-    # Switch to registration form
-    register_link = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.LINK_TEXT, "Register here"))
-    )
-    register_link.click()
-    
-    # Fill registration form
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "registerForm"))
-    )
-    
-    driver.find_element(By.ID, "registerUsername").send_keys(test_user["username"])
-    driver.find_element(By.ID, "registerEmail").send_keys(test_user["email"])
-    driver.find_element(By.ID, "registerPassword").send_keys(test_user["password"])
-    driver.find_element(By.ID, "registerFullName").send_keys(test_user["fullName"])
-    
-    # Submit registration
-    register_button = driver.find_element(By.CSS_SELECTOR, "#registerForm button[type='submit']")
-    register_button.click()
-    
-    time.sleep(2)
-    
-    # Login
-    driver.get(f"{base_url}/login.html")
-    
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "loginForm"))
-    )
-    
-    driver.find_element(By.ID, "loginUsername").send_keys(test_user["username"])
-    driver.find_element(By.ID, "loginPassword").send_keys(test_user["password"])
-    
-    login_button = driver.find_element(By.CSS_SELECTOR, "#loginForm button[type='submit']")
-    login_button.click()
-    
-    # Wait for redirect to dashboard
-    WebDriverWait(driver, 10).until(
-        EC.url_contains("index.html")
-    )
+pytestmark = [pytest.mark.regression, pytest.mark.profile]
 
 
-def test_profile_view(driver, base_url, test_user):
+def test_profile_view(logged_in_driver, test_user):
     """
     Test Case 6: Profile View Test
     
@@ -67,8 +22,8 @@ def test_profile_view(driver, base_url, test_user):
     4. Verify email is displayed
     5. Verify full name is displayed
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Navigate to Profile tab
     profile_tab = WebDriverWait(driver, 10).until(
@@ -98,12 +53,12 @@ def test_profile_view(driver, base_url, test_user):
     assert test_user["fullName"] in profile_text, f"Full name '{test_user['fullName']}' should be displayed in profile"
 
 
-def test_profile_edit_button_present(driver, base_url, test_user):
+def test_profile_edit_button_present(logged_in_driver, test_user):
     """
     Test that profile edit functionality is accessible
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Navigate to Profile tab
     profile_tab = WebDriverWait(driver, 10).until(
@@ -125,12 +80,12 @@ def test_profile_edit_button_present(driver, base_url, test_user):
         pass
 
 
-def test_profile_displays_account_creation_date(driver, base_url, test_user):
+def test_profile_displays_account_creation_date(logged_in_driver, test_user):
     """
     Test that profile displays account creation date
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Navigate to Profile tab
     profile_tab = WebDriverWait(driver, 10).until(
@@ -155,12 +110,12 @@ def test_profile_displays_account_creation_date(driver, base_url, test_user):
     assert len(profile_text) > 0, "Profile should display user information"
 
 
-def test_profile_view_after_navigation(driver, base_url, test_user):
+def test_profile_view_after_navigation(logged_in_driver, test_user):
     """
     Test that profile view persists correctly after navigating away and back
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Navigate to Profile tab
     profile_tab = WebDriverWait(driver, 10).until(
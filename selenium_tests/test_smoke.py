@@ -0,0 +1,77 @@
+"""
+Smoke Tier: homepage load, login and dashboard on one shared browser
+
+These tests share a single warm Chrome instance and a single authenticated
+session, and run in the order they are defined. Run the tier on its own with
+`python run_tests.py --tier smoke`; it aborts on the first failure and fails
+when it exceeds --smoke-budget seconds. Waits use the smoke_timeout fixture,
+the time left in that budget, so a hanging test cannot overrun it.
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from data_lifecycle import register_user
+
+pytestmark = pytest.mark.smoke
+
+
+def test_smoke_homepage_loads(shared_driver, smoke_timeout, base_url):
+    """
+    Smoke: login page is served and renders its form
+    """
+    shared_driver.delete_all_cookies()
+    shared_driver.get(f"{base_url}/login.html")
+
+    assert "Student" in shared_driver.title, f"Unexpected page title: {shared_driver.title}"
+    login_form = WebDriverWait(shared_driver, smoke_timeout).until(
+        EC.visibility_of_element_located((By.ID, "loginFormElement"))
+    )
+    assert login_form.is_displayed(), "Login form should be visible"
+
+
+def test_smoke_login(shared_driver, smoke_timeout, base_url, test_user):
+    """
+    Smoke: valid credentials log in through the form and open the dashboard
+    """
+    register_user(base_url, test_user)
+    shared_driver.get(f"{base_url}/login.html")
+
+    WebDriverWait(shared_driver, smoke_timeout).until(
+        EC.visibility_of_element_located((By.ID, "loginUsername"))
+    ).send_keys(test_user["username"])
+    shared_driver.find_element(By.ID, "loginPassword").send_keys(test_user["password"])
+    shared_driver.find_element(By.CSS_SELECTOR, "#loginFormElement button[type='submit']").click()
+
+    navbar = WebDriverWait(shared_driver, smoke_timeout).until(
+        EC.visibility_of_element_located((By.ID, "navbar"))
+    )
+    assert navbar.is_displayed(), "Navigation bar should be visible after login"
+    assert shared_driver.find_element(By.ID, "navUsername").text == test_user["username"]
+
+
+def test_smoke_students_list_loads(smoke_session, smoke_timeout):
+    """
+    Smoke: Students tab fetches and renders the student list
+    """
+    smoke_session.find_element(By.CSS_SELECTOR, ".nav-tab[data-tab='students']").click()
+    WebDriverWait(smoke_session, smoke_timeout).until(
+        EC.visibility_of_element_located((By.ID, "studentsTab"))
+    )
+    # Checked in the page: find_element would sit out the implicit wait once it is gone
+    WebDriverWait(smoke_session, smoke_timeout).until(
+        lambda d: d.execute_script("return !document.querySelector('#studentsContainer .loading')")
+    )
+    container = smoke_session.find_element(By.ID, "studentsContainer")
+    assert "Error loading students" not in container.text, "Student list failed to load"
+
+
+def test_smoke_profile_loads(smoke_session, smoke_timeout, test_user):
+    """
+    Smoke: Profile tab shows the logged-in user
+    """
+    smoke_session.find_element(By.CSS_SELECTOR, ".nav-tab[data-tab='profile']").click()
+    WebDriverWait(smoke_session, smoke_timeout).until(
+        EC.text_to_be_present_in_element((By.ID, "profileUsername"), test_user["username"])
+    )
@@ -0,0 +1,134 @@
+"""
+SPA Soak Test: front-end memory-leak detection for long-lived dashboard tabs
+
+Loops through tab switches, profile loads and student create/edit/delete
+cycles, sampling JS heap, DOM nodes and event listeners after forced GC,
+and fails when the fitted growth slope exceeds the thresholds in
+leak_detection.py. Run with: pytest test_soak.py --soak
+"""
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from leak_detection import SLOPE_UNITS, growth_violations, sample_memory
+
+# Iterations run before sampling starts, so caches and JIT warm-up do not count as growth
+WARMUP_ITERATIONS = 10
+
+# Take a memory sample every N iterations
+SAMPLE_EVERY = 10
+
+
+def switch_tab(driver, tab_name):
+    """
+    Click a navigation tab and wait for its content to show
+    """
+    driver.find_element(By.CSS_SELECTOR, f".nav-tab[data-tab='{tab_name}']").click()
+    WebDriverWait(driver, 10).until(
+        EC.visibility_of_element_located((By.ID, f"{tab_name}Tab"))
+    )
+
+
+def student_card_locator(registration_number):
+    return (
+        By.XPATH,
+        f"//div[contains(@class, 'student-card')]"
+        f"[.//div[@class='student-reg' and text()='{registration_number}']]"
+    )
+
+
+def fill_student_form(driver, student):
+    for field in ("name", "registrationNumber", "email", "phone", "address"):
+        element = driver.find_element(By.ID, field)
+        element.clear()
+        element.send_keys(student[field])
+    driver.find_element(By.CSS_SELECTOR, "#studentForm button[type='submit']").click()
+
+
+def student_cycle(driver, iteration):
+    """
+    Create, edit and delete one student through the UI
+    """
+    student = {
+        "name": f"Soak Student {iteration}",
+        "registrationNumber": f"SOAK{int(time.time() * 1000)}",
+        "email": f"soak{iteration}@example.com",
+        "phone": "1234567890",
+        "address": "1 Soak Street"
+    }
+    card = student_card_locator(student["registrationNumber"])
+
+    # Create
+    fill_student_form(driver, student)
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located(card))
+
+    # Edit
+    driver.find_element(*card).find_element(By.CLASS_NAME, "btn-edit").click()
+    WebDriverWait(driver, 10).until(
+        lambda d: d.find_element(By.ID, "editingId").get_attribute("value")
+    )
+    student["name"] = f"Soak Student {iteration} (edited)"
+    fill_student_form(driver, student)
+    WebDriverWait(driver, 10).until(
+        lambda d: student["name"] in d.find_element(*card).text
+    )
+
+    # Delete (confirm dialog)
+    driver.find_element(*card).find_element(By.CLASS_NAME, "btn-delete").click()
+    WebDriverWait(driver, 10).until(EC.alert_is_present()).accept()
+    WebDriverWait(driver, 10).until(EC.invisibility_of_element_located(card))
+
+
+@pytest.mark.soak
+def test_spa_soak_memory_growth(logged_in_driver, request, test_user, perf):
+    """
+    Soak Test: Long-lived dashboard tab
+
+    Steps (per iteration):
+    1. Switch to Students tab
+    2. Create, edit and delete a student
+    3. Switch to Profile tab and verify profile is loaded
+    4. Switch to Home tab
+    Every SAMPLE_EVERY iterations after warm-up, force GC and sample memory.
+    Finally, verify no metric grows faster than its threshold.
+    """
+    driver = logged_in_driver
+    iterations = request.config.getoption("--soak-iterations")
+    duration = request.config.getoption("--soak-duration")
+    deadline = time.monotonic() + duration if duration else None
+
+    driver.execute_cdp_cmd("HeapProfiler.enable", {})
+
+    samples = []
+    iteration = 0
+    while (time.monotonic() < deadline) if deadline else (iteration < iterations):
+        switch_tab(driver, "students")
+        student_cycle(driver, iteration)
+
+        switch_tab(driver, "profile")
+        WebDriverWait(driver, 10).until(
+            EC.text_to_be_present_in_element((By.ID, "profileUsername"), test_user["username"])
+        )
+
+        switch_tab(driver, "home")
+
+        iteration += 1
+        if iteration > WARMUP_ITERATIONS and iteration % SAMPLE_EVERY == 0:
+            samples.append((iteration, sample_memory(driver)))
+
+    assert len(samples) >= 3, (
+        f"Soak ran {iteration} iterations, too few to fit a growth slope; "
+        f"increase --soak-iterations or --soak-duration"
+    )
+
+    violations, slopes = growth_violations(samples)
+    for metric, slope in slopes.items():
+        perf.record(f"{metric}_growth", slope, unit=SLOPE_UNITS[metric])
+    perf.record("soak_iterations", iteration, unit="count")
+
+    assert not violations, "Front-end memory growth detected: " + ", ".join(
+        f"{metric} grows {slope:.2f} per iteration" for metric, slope in violations.items()
+    )
@@ -8,62 +8,14 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
+pytestmark = [pytest.mark.regression, pytest.mark.student]
 
-def login_user(driver, base_url, username, password):
-    """
-    Helper function to login a user
-    """
-    driver.get(f"{base_url}/login.html")
-    
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "loginForm"))
-    )
-    
-    driver.find_element(By.ID, "loginUsername").send_keys(username)
-    driver.find_element(By.ID, "loginPassword").send_keys(password)
-    
-    login_button = driver.find_element(By.CSS_SELECTOR, "#loginForm button[type='submit']")
-    login_button.click()
-    
-    # Wait for redirect to dashboard
-    WebDriverWait(driver, 10).until(
-        EC.url_contains("index.html")
-    )
-
-
-def register_and_login(driver, base_url, test_user):
-    """
-    Helper function to register and login a user
-    """
-    driver.get(f"{base_url}/login.html")
-    
-    # Switch to registration form
-    register_link = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.LINK_TEXT, "Register here"))
-    )
-    register_link.click()
-    
-    # Fill registration form
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "registerForm"))
-    )
-    
-    driver.find_element(By.ID, "registerUsername").send_keys(test_user["username"])
-    driver.find_element(By.ID, "registerEmail").send_keys(test_user["email"])
-    driver.find_element(By.ID, "registerPassword").send_keys(test_user["password"])
-    driver.find_element(By.ID, "registerFullName").send_keys(test_user["fullName"])
-    
-    # Submit registration
-    register_button = driver.find_element(By.CSS_SELECTOR, "#registerForm button[type='submit']")
-    register_button.click()
-    
-    time.sleep(2)
-    
-    # Login
-    login_user(driver, base_url, test_user["username"], test_user["password"])
+# True once fetchStudents() has replaced the initial "Loading students..." placeholder.
+# Checked in the page: find_element would sit out the implicit wait once it is gone.
+STUDENTS_LOADED_SCRIPT = "return !document.querySelector('#studentsContainer .loading')"
 
 
-def test_student_creation(driver, base_url, test_user):
+def test_student_creation(logged_in_driver, base_url, perf):
     """
     Test Case 4: Student Creation Test
     
@@ -75,19 +27,19 @@ def test_student_creation(driver, base_url, test_user):
     5. Verify student appears in list
     6. Verify success message
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
-    
-    # Navigate to Students tab
-    students_tab = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-tab='students']"))
-    )
-    students_tab.click()
-    
-    # Wait for students section to be visible
-    students_section = WebDriverWait(driver, 10).until(
-        EC.visibility_of_element_located((By.ID, "students"))
-    )
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
+    
+    # Open the dashboard on the Students tab, timing until the list is rendered
+    with perf.measure("student_list"):
+        driver.get(f"{base_url}/index.html")
+        WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, ".nav-tab[data-tab='students']"))
+        ).click()
+        WebDriverWait(driver, 10).until(
+            EC.visibility_of_element_located((By.ID, "studentsTab"))
+        )
+        WebDriverWait(driver, 10).until(lambda d: d.execute_script(STUDENTS_LOADED_SCRIPT))
     
     # Fill student form with valid data
     student_data = {
@@ -98,21 +50,20 @@ def test_student_creation(driver, base_url, test_user):
         "address": "123 Main Street, City"
     }
     
-    driver.find_element(By.ID, "studentName").send_keys(student_data["name"])
-    driver.find_element(By.ID, "studentRegNumber").send_keys(student_data["registrationNumber"])
-    driver.find_element(By.ID, "studentEmail").send_keys(student_data["email"])
-    driver.find_element(By.ID, "studentPhone").send_keys(student_data["phone"])
-    driver.find_element(By.ID, "studentAddress").send_keys(student_data["address"])
+    for field, value in student_data.items():
+        driver.find_element(By.ID, field).send_keys(value)
     
     # Submit form
     submit_button = driver.find_element(By.CSS_SELECTOR, "#studentForm button[type='submit']")
     submit_button.click()
     
     # Wait for student to appear in list
-    time.sleep(2)
+    WebDriverWait(driver, 10).until(
+        EC.text_to_be_present_in_element((By.ID, "studentsContainer"), student_data["registrationNumber"])
+    )
     
     # Verify student appears in the list
-    student_list = driver.find_element(By.ID, "studentList")
+    student_list = driver.find_element(By.ID, "studentsContainer")
     student_cards = student_list.find_elements(By.CLASS_NAME, "student-card")
     
     assert len(student_cards) > 0, "At least one student should be in the list"
@@ -129,26 +80,26 @@ def test_student_creation(driver, base_url, test_user):
     assert student_found, f"Created student with registration number {student_data['registrationNumber']} should appear in list"
     
     # Verify form is cleared after submission
-    name_input = driver.find_element(By.ID, "studentName")
+    name_input = driver.find_element(By.ID, "name")
     assert name_input.get_attribute("value") == "", "Form should be cleared after submission"
 
 
-def test_student_form_validation(driver, base_url, test_user):
+def test_student_form_validation(logged_in_driver):
     """
     Test that student form validates required fields
     """
-    # Register and login
-    register_and_login(driver, base_url, test_user)
+    # Logged in through the API; the user is registered once, not per test
+    driver = logged_in_driver
     
     # Navigate to Students tab
     students_tab = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-tab='students']"))
+        EC.element_to_be_clickable((By.CSS_SELECTOR, ".nav-tab[data-tab='students']"))
     )
     students_tab.click()
     
     # Wait for students section
     WebDriverWait(driver, 10).until(
-        EC.visibility_of_element_located((By.ID, "students"))
+        EC.visibility_of_element_located((By.ID, "studentsTab"))
     )
     
     # Try to submit empty form
@@ -157,5 +108,5 @@ def test_student_form_validation(driver, base_url, test_user):
     
     # Verify we're still on the students tab (form didn't submit)
     time.sleep(1)
-    students_section = driver.find_element(By.ID, "students")
+    students_section = driver.find_element(By.ID, "studentsTab")
     assert students_section.is_displayed(), "Should remain on students section with invalid form"
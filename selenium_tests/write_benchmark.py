@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Write-path throughput and contention benchmark for student creation and edits
+
+Drives a concurrent mix of POST/PUT/DELETE /api/students at increasing
+request rates, including deliberate registration-number collisions, and
+reports sustained operations and successful writes per second, latency
+percentiles and the duplicate-key error rate. A separate phase seeds the
+collection to several sizes and repeats one fixed-rate step at each, so
+latency growth reflects collection size rather than load.
+
+Usage:
+    python write_benchmark.py [--rates 10,20,40,80,160] [--step-duration 10]
+                              [--growth-sizes 100,500,1000] [--growth-rate 10]
+                              [--sample-backend CONTAINER] [--sample-mongod CONTAINER]
+"""
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from data_lifecycle import register_user
+from performance import fit_slope
+from resource_sampler import add_sampler_arguments, start_sampler, stop_sampler
+
+
+BENCHMARK_USER = {
+    "username": "benchuser",
+    "email": "benchuser@example.com",
+    "password": "BenchPassword123!",
+    "fullName": "Benchmark User"
+}
+
+# Relative weight of each operation in the write mix
+DEFAULT_MIX = {"create": 0.5, "edit": 0.3, "delete": 0.1, "collide": 0.1}
+
+# A step is saturated when it answers less than this fraction of its target rate
+# within its scheduled window
+SATURATION_RATIO = 0.9
+
+
+class ApiClient:
+    """
+    Authenticated JSON client sharing one session cookie across threads
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+
+    def request(self, method, path, body=None):
+        """
+        Send a request and return (status, parsed JSON body or None)
+        """
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        request = urllib.request.Request(
+            f"{self.base_url}{path}", data=data, method=method,
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with self.opener.open(request, timeout=30) as response:
+                status, payload = response.status, response.read()
+        except urllib.error.HTTPError as e:
+            status, payload = e.code, e.read()
+        try:
+            return status, json.loads(payload)
+        except ValueError:
+            return status, None
+
+    def login(self, user):
+        status, _ = self.request("POST", "/api/auth/login",
+                                 {"username": user["username"], "password": user["password"]})
+        if status != 200:
+            raise RuntimeError(f"Login failed with status {status}")
+
+
+class WriteWorkload:
+    """
+    Generates the operation mix and tracks the students it created
+    """
+
+    def __init__(self, client, mix, reload_list=False):
+        self.client = client
+        self.operations = list(mix)
+        self.weights = [mix[name] for name in self.operations]
+        self.reload_list = reload_list
+        self.students = {}
+        self.lock = threading.Lock()
+        self.counter = 0
+        self.prefix = f"WB{int(time.time())}"
+
+    def _new_student(self):
+        with self.lock:
+            self.counter += 1
+            n = self.counter
+        return {
+            "name": f"Bench Student {n}",
+            "registrationNumber": f"{self.prefix}-{n}",
+            "email": f"bench{n}@example.com",
+            "phone": "1234567890",
+            "address": "1 Benchmark Road"
+        }
+
+    def _pick(self, remove=False):
+        with self.lock:
+            if not self.students:
+                return None, None
+            student_id = random.choice(list(self.students))
+            payload = self.students.pop(student_id) if remove else self.students[student_id]
+            return student_id, payload
+
+    def run_one(self):
+        """
+        Execute one randomly chosen operation and return (operation, status, duplicate)
+        """
+        operation = random.choices(self.operations, self.weights)[0]
+        duplicate = False
+
+        # Edits, deletes and collisions need an existing student; create one otherwise
+        student_id, student = self._pick(remove=operation == "delete")
+        if student_id is None:
+            operation = "create"
+
+        if operation == "create":
+            status = self._create()
+        elif operation == "edit":
+            edited = dict(student, name=f"{student['name']} (edited)")
+            status, _ = self.client.request("PUT", f"/api/students/{student_id}", edited)
+        elif operation == "delete":
+            status, _ = self.client.request("DELETE", f"/api/students/{student_id}")
+        else:
+            # Reuse an existing registration number on a create or an edit
+            colliding = dict(self._new_student(), registrationNumber=student["registrationNumber"])
+            other_id, _ = self._pick()
+            if other_id == student_id or random.random() < 0.5:
+                status, body = self.client.request("POST", "/api/students", colliding)
+            else:
+                status, body = self.client.request("PUT", f"/api/students/{other_id}", colliding)
+            duplicate = status == 400 and "already exists" in json.dumps(body or {})
+
+        if self.reload_list:
+            # Mirror public/app.js, which reloads the full list after every save
+            self.client.request("GET", "/api/students")
+        return operation, status, duplicate
+
+    def _create(self):
+        student = self._new_student()
+        status, body = self.client.request("POST", "/api/students", student)
+        if status == 201:
+            with self.lock:
+                self.students[body["_id"]] = student
+        return status
+
+    def fill(self, size, concurrency):
+        """
+        Create students until the collection holds size documents
+
+        Raises RuntimeError when it already holds more, since the step run at
+        that size would measure a larger collection than requested.
+        """
+        missing = size - (self.collection_size() or 0)
+        if missing < 0:
+            raise RuntimeError(
+                f"Collection already holds {size - missing} students, more than the "
+                f"requested growth size {size}"
+            )
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda _: self._create(), range(missing)))
+
+    def collection_size(self):
+        status, body = self.client.request("GET", "/api/students")
+        return len(body) if status == 200 else None
+
+    def cleanup(self):
+        for student_id in list(self.students):
+            self.client.request("DELETE", f"/api/students/{student_id}")
+        self.students.clear()
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_step(workload, rate, duration, concurrency):
+    """
+    Issue operations at a fixed target rate (open loop) for one step
+
+    Latency is measured from each operation's scheduled start, so queueing
+    behind a saturated backend counts against it instead of slowing the load.
+    Throughput counts only operations answered within the scheduled window;
+    work drained after it is not throughput the backend sustained.
+    """
+    results = []
+    results_lock = threading.Lock()
+    size_before = workload.collection_size()
+
+    def execute(scheduled):
+        operation, status, duplicate = workload.run_one()
+        finished = time.perf_counter()
+        with results_lock:
+            results.append((operation, status, duplicate, (finished - scheduled) * 1000, finished))
+
+    interval = 1.0 / rate
+    wall_start = time.time()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        n = 0
+        while True:
+            scheduled = start + n * interval
+            if scheduled - start >= duration:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(execute, scheduled)
+            n += 1
+    window = n * interval
+    window_end = start + window
+    wall_end = time.time()
+
+    # Expected 4xx answers (collisions) are completed work; 5xx are not
+    in_window = [r for r in results if r[4] <= window_end]
+    answered = [r for r in in_window if r[1] < 500]
+    ok = [r for r in in_window if 200 <= r[1] < 300]
+    latencies = [r[3] for r in results]
+    collisions = [r for r in results if r[0] == "collide"]
+    return {
+        "target_rate": rate,
+        "start": wall_start,
+        "end": wall_end,
+        "operations": len(results),
+        "operations_per_second": round(len(answered) / window, 2),
+        "writes_per_second": round(len(ok) / window, 2),
+        "p50_ms": percentile(latencies, 0.50),
+        "p90_ms": percentile(latencies, 0.90),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": max(latencies) if latencies else None,
+        "by_operation": {
+            name: {
+                "count": len(mine),
+                "p50_ms": percentile([r[3] for r in mine], 0.50),
+                "p99_ms": percentile([r[3] for r in mine], 0.99),
+            }
+            for name in workload.operations
+            for mine in [[r for r in results if r[0] == name]]
+        },
+        "duplicate_key_errors": sum(1 for r in collisions if r[2]),
+        "duplicate_key_error_rate": (
+            round(sum(1 for r in collisions if r[2]) / len(collisions), 3) if collisions else None
+        ),
+        "server_errors": sum(1 for r in results if r[1] >= 500),
+        "collection_size_before": size_before,
+        "collection_size_after": workload.collection_size(),
+    }
+
+
+def run_growth(workload, sizes, rate, duration, concurrency):
+    """
+    Repeat one fixed-rate step after seeding the collection to each size
+
+    Each step is tagged with its requested growth_size; the students left by
+    earlier steps must be cleaned up first so the smallest size is reachable.
+    """
+    steps = []
+    for size in sorted(sizes):
+        workload.fill(size, concurrency)
+        step = run_step(workload, rate, duration, concurrency)
+        step["growth_size"] = size
+        steps.append(step)
+    return steps
+
+
+def latency_growth(growth_steps):
+    """
+    Fitted change in median latency (ms) per 1000 documents in the collection
+
+    Uses the fixed-rate steps of run_growth() so only the collection size varies.
+    """
+    points = [
+        (s["collection_size_before"], s["p50_ms"]) for s in growth_steps
+        if s["collection_size_before"] is not None and s["p50_ms"] is not None
+    ]
+    if len(points) < 2:
+        return None
+    return round(fit_slope([p[0] for p in points], [p[1] for p in points]) * 1000, 3)
+
+
+def to_records(steps, growth_steps, growth):
+    """
+    Convert step results to performance records for perf_trends.py
+
+    Records carry phase start/end so resource_sampler.correlate() can line
+    them up with backend samples.
+    """
+    records = []
+    for step in steps:
+        phase = f"write_benchmark@{step['target_rate']}rps"
+        for metric in ("p50_ms", "p90_ms", "p99_ms"):
+            if step[metric] is not None:
+                records.append({
+                    "test": "write_benchmark", "metric": f"{metric[:-3]}@{step['target_rate']}rps",
+                    "value_ms": round(step[metric], 2), "phase": phase,
+                    "start": step["start"], "end": step["end"],
+                })
+    for step in growth_steps:
+        if step["p50_ms"] is not None:
+            # Named after the requested size so the series is stable across runs
+            size = step["growth_size"]
+            records.append({
+                "test": "write_benchmark", "metric": f"p50@{size}docs",
+                "value_ms": round(step["p50_ms"], 2), "phase": f"write_benchmark@{size}docs",
+                "start": step["start"], "end": step["end"],
+            })
+    if growth is not None:
+        records.append({"test": "write_benchmark", "metric": "p50_growth_per_1000_docs",
+                        "value_ms": growth})
+    return records
+
+
+def format_step(step):
+    return (
+        f"{step['target_rate']:>7}{step['operations_per_second']:>8.1f}{step['writes_per_second']:>10.1f}"
+        f"{step['p50_ms'] or 0:>9.1f}{step['p90_ms'] or 0:>9.1f}{step['p99_ms'] or 0:>9.1f}"
+        f"{(step['duplicate_key_error_rate'] or 0) * 100:>8.1f}%"
+        f"{step['server_errors']:>7}{step['collection_size_after'] or 0:>9}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Student write-path throughput benchmark")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "http://localhost"))
+    parser.add_argument("--rates", default="10,20,40,80,160",
+                        help="Comma-separated target operations per second, one step each")
+    parser.add_argument("--step-duration", type=float, default=10.0, help="Seconds per step")
+    parser.add_argument("--concurrency", type=int, default=32, help="Maximum in-flight requests")
+    parser.add_argument("--mix", default=None,
+                        help="Operation weights, e.g. create=0.5,edit=0.3,delete=0.1,collide=0.1")
+    parser.add_argument("--reload-list", action="store_true",
+                        help="GET the full student list after every write, like the UI does")
+    parser.add_argument("--growth-sizes", default="100,500,1000",
+                        help="Comma-separated collection sizes to seed for the latency growth "
+                             "phase (empty to skip)")
+    parser.add_argument("--growth-rate", type=int, default=10,
+                        help="Fixed operations per second used at every growth size")
+    parser.add_argument("--p99-slo", type=float, default=500.0,
+                        help="p99 latency in ms above which a step counts as tipped over")
+    parser.add_argument("--keep-data", action="store_true", help="Do not delete created students")
+    parser.add_argument("--output", default="write_benchmark.json", help="JSON results file")
+    add_sampler_arguments(parser, timeline_output="write_benchmark_timeline.json")
+    args = parser.parse_args()
+
+    mix = dict(DEFAULT_MIX)
+    if args.mix:
+        mix = {k: float(v) for k, v in (part.split("=") for part in args.mix.split(","))}
+
+    register_user(args.base_url, BENCHMARK_USER)
+    client = ApiClient(args.base_url)
+    client.login(BENCHMARK_USER)
+    workload = WriteWorkload(client, mix, reload_list=args.reload_list)
+    sampler = start_sampler(args)
+
+    print(f"Write benchmark against {args.base_url}, mix: {mix}")
+    print(f"{'Target':>7}{'Ops/s':>8}{'Writes/s':>10}{'p50':>9}{'p90':>9}{'p99':>9}{'DupErr':>9}{'5xx':>7}{'Docs':>9}")
+    steps = []
+    growth_steps = []
+    tipping_point = None
+    try:
+        for rate in (int(r) for r in args.rates.split(",")):
+            step = run_step(workload, rate, args.step_duration, args.concurrency)
+            steps.append(step)
+            print(format_step(step))
+            saturated = step["operations_per_second"] < SATURATION_RATIO * rate
+            if tipping_point is None and (saturated or (step["p99_ms"] or 0) > args.p99_slo):
+                tipping_point = rate
+
+        sizes = [int(size) for size in args.growth_sizes.split(",") if size]
+        if sizes:
+            print(f"Latency growth at {args.growth_rate} ops/s:")
+            # Start from the students that existed before the rate steps
+            workload.cleanup()
+            growth_steps = run_growth(workload, sizes, args.growth_rate,
+                                      args.step_duration, args.concurrency)
+            for step in growth_steps:
+                print(format_step(step))
+    finally:
+        if not args.keep_data:
+            workload.cleanup()
+        if sampler is not None:
+            # Line the backend samples up with each rate and growth step
+            stop_sampler(sampler, args,
+                         to_records(steps, growth_steps, latency_growth(growth_steps)))
+
+    growth = latency_growth(growth_steps)
+    if growth is not None:
+        print(f"Median latency growth: {growth} ms per 1000 documents")
+    if tipping_point is not None:
+        print(f"Tipping point: {tipping_point} ops/s (answered operations below "
+              f"{SATURATION_RATIO:.0%} of target or p99 above {args.p99_slo:g} ms)")
+    else:
+        print("No tipping point reached at the tested rates")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "mix": mix,
+            "steps": steps,
+            "growth_steps": growth_steps,
+            "tipping_point": tipping_point,
+            "p50_growth_ms_per_1000_docs": growth,
+            "records": to_records(steps, growth_steps, growth),
+        }, f, indent=2)
+    print(f"Results written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()